@@ -1,9 +1,10 @@
 # 参考 URL
 # https://snuke.hatenablog.com/entry/2019/05/07/013609
 
-from random import shuffle
+from array import array
+
 class Bipartite_Matching:
-    __slots__ = ("__M", "__N", "__edges", "__size", "__matching")
+    __slots__ = ("__M", "__N", "__source", "__target", "__size", "__matching", "__p", "__q")
 
     def __init__(self, M: int, N: int):
         """ 部集合の大きさが M, N である二部グラフを生成する.
@@ -15,7 +16,10 @@ class Bipartite_Matching:
 
         self.__M = M
         self.__N = N
-        self.__edges: list[list[int]] = [[] for _ in range(M)]
+        self.__source = array('i')
+        self.__target = array('i')
+        self.__p = None
+        self.__q = None
 
     @property
     def M(self) -> int:
@@ -48,79 +52,242 @@ class Bipartite_Matching:
         assert 0 <= a < self.M
         assert 0 <= b < self.N
 
-        self.__edges[a].append(b)
+        self.__source.append(a)
+        self.__target.append(b)
+
+    def __csr(self, n: int, source: array, target: array) -> tuple[array, array]:
+        """ 辺 (source[i], target[i]) から, 始点ごとの CSR 表現 (offset, target) を作る. """
+
+        offset = array('i', bytes(4 * (n + 1)))
+        for a in source:
+            offset[a + 1] += 1
+        for a in range(n):
+            offset[a + 1] += offset[a]
+
+        position = offset[:-1]
+        csr_target = array('i', bytes(4 * len(target)))
+        for a, b in zip(source, target):
+            csr_target[position[a]] = b
+            position[a] += 1
+
+        return offset, csr_target
+
+    def __greedy(self, offset: list[int], target: list[int], p: list[int], q: list[int]) -> int:
+        """ 貪欲に (まだ使われていない頂点同士を) マッチングさせる. 返り値は増えた辺の数. """
+
+        count = 0
+        for a in range(self.M):
+            if p[a] != -1:
+                continue
+
+            for k in range(offset[a], offset[a + 1]):
+                b = target[k]
+                if q[b] == -1:
+                    p[a] = b; q[b] = a
+                    count += 1
+                    break
+        return count
+
+    def __karp_sipser(self, offset: list[int], target: list[int], p: list[int], q: list[int]) -> int:
+        """ Karp-Sipser 法 (次数 1 の頂点を優先してマッチングさせる) によって初期マッチングを作る. 返り値は増えた辺の数.
+
+        次数 1 の頂点の辺は, ある最大マッチングに含まれるので, その辺を採用しても最大性は失われない.
+        次数 1 の頂点が無くなったら, 残りは貪欲法で決める.
+        """
 
-    def calculate(self, matching = False):
+        M = self.M; N = self.N
+        r_offset, r_target = self.__csr(N, self.__target, self.__source)
+
+        # 部集合 1 の頂点は 0, ..., M - 1, 部集合 2 の頂点 b は M + b として, まだマッチングしていない近傍の数を数える.
+        deg = [0] * (M + N)
+        for a in range(M):
+            if p[a] != -1:
+                continue
+            for k in range(offset[a], offset[a + 1]):
+                if q[target[k]] == -1:
+                    deg[a] += 1
+                    deg[M + target[k]] += 1
+
+        def match(a: int, b: int):
+            p[a] = b; q[b] = a
+            for k in range(offset[a], offset[a + 1]):
+                c = target[k]
+                if q[c] == -1:
+                    deg[M + c] -= 1
+                    if deg[M + c] == 1:
+                        stack.append(M + c)
+            for k in range(r_offset[b], r_offset[b + 1]):
+                c = r_target[k]
+                if p[c] == -1:
+                    deg[c] -= 1
+                    if deg[c] == 1:
+                        stack.append(c)
+
+        stack = [x for x in range(M + N) if deg[x] == 1]
+        count = 0
+        while stack:
+            x = stack.pop()
+            if x < M:
+                if p[x] != -1:
+                    continue
+                for k in range(offset[x], offset[x + 1]):
+                    if q[target[k]] == -1:
+                        match(x, target[k])
+                        count += 1
+                        break
+            else:
+                b = x - M
+                if q[b] != -1:
+                    continue
+                for k in range(r_offset[b], r_offset[b + 1]):
+                    if p[r_target[k]] == -1:
+                        match(r_target[k], b)
+                        count += 1
+                        break
+
+        return count + self.__greedy(offset, target, p, q)
+
+    def calculate(self, matching = False, method = "forest", initial = "greedy", resume = True):
         """ 最大マッチングを計算する (結果は property メソッドで参照する).
 
         Args:
             matching (bool, optional): True にすると, 最大マッチングの一例も一緒に求める. Defaults to False.
+            method (str, optional): "forest" (自由な頂点からの交互森を育てて, 見つかり次第増加させる) or "hopcroft_karp". Defaults to "forest".
+            initial (str, optional): 初期マッチングの作り方. "greedy", "karp_sipser", None (作らない). Defaults to "greedy".
+            resume (bool, optional): True のとき, 前回の calculate で求めたマッチングから再開する (その後に add_edge で辺を追加していても良い). Defaults to True.
         """
 
-        for a in range(self.M):
-            shuffle(self.__edges[a])
+        M = self.M; N = self.N
+        offset, target = self.__csr(M, self.__source, self.__target)
+        offset = offset.tolist(); target = target.tolist()
+
+        if resume and self.__p is not None:
+            p = self.__p; q = self.__q
+            size = M - p.count(-1)
+        else:
+            p = [-1] * M
+            q = [-1] * N
+            size = 0
+
+        if initial == "greedy":
+            size += self.__greedy(offset, target, p, q)
+        elif initial == "karp_sipser":
+            size += self.__karp_sipser(offset, target, p, q)
+
+        if method == "hopcroft_karp":
+            size += self.__hopcroft_karp(offset, target, p, q)
+        else:
+            size += self.__forest(offset, target, p, q)
+
+        self.__p = p; self.__q = q
+        self.__size = size
 
-        edge = self.__edges
-        pre = [-1] * self.M
-        root = [-1] * self.M
-        p = [-1] * self.M
-        q = [-1] * self.N
+        A = p[:]
+        B = q[:]
+        self.__matching = (A, B)
+
+    def __forest(self, offset: list[int], target: list[int], p: list[int], q: list[int]) -> int:
+        """ 自由な頂点を根とする交互森を BFS で育て, 自由な頂点に届いたらすぐに増加させる. 返り値は増えた辺の数.
+
+        増加した木はその段階ではそれ以上育てない. 1 段階で 1 本も増加しなくなるまで繰り返す.
+        """
 
+        M = self.M
+        count = 0
         updated = True
-        size = 0
         while updated:
             updated = False
+            pre = [-1] * M
+            root = [-1] * M
             S = []
-            index = 0
-
-            for i in range(self.M):
-                if p[i] == -1:
-                    root[i] = i
-                    S.append(i)
-
-            while index < len(S):
-                v = S[index]
-                index += 1
+            for a in range(M):
+                if p[a] == -1:
+                    root[a] = a
+                    S.append(a)
 
+            for v in S:
                 if p[root[v]] != -1:
                     continue
 
-                for u in edge[v]:
-                    if q[u] == -1:
+                for u in target[offset[v]: offset[v + 1]]:
+                    w = q[u]
+                    if w == -1:
                         while u != -1:
                             q[u] = v
                             p[v], u = u, p[v]
                             v = pre[v]
                         updated = True
-                        size += 1
+                        count += 1
                         break
 
-                    u = q[u]
-                    if pre[u] != -1:
+                    if pre[w] != -1 or root[w] != -1:
                         continue
 
-                    pre[u] = v
-                    root[u] = root[v]
-                    S.append(u)
+                    pre[w] = v
+                    root[w] = root[v]
+                    S.append(w)
 
-            if updated:
-                pre = [-1] * self.M
-                root = [-1] * self.M
+        return count
 
-        self.__size = size
+    def __hopcroft_karp(self, offset: list[int], target: list[int], p: list[int], q: list[int]) -> int:
+        """ Hopcroft-Karp 法: BFS で最短の増加路の層を作り, DFS で層に沿った増加路を流せるだけ流す. 返り値は増えた辺の数. """
+
+        M = self.M
+        size = 0
+        while True:
+            # BFS で, 自由な頂点からの交互路の長さによる層を作る.
+            dist = [-1] * M
+            Q = [a for a in range(M) if p[a] == -1]
+            for a in Q:
+                dist[a] = 0
+
+            # 最短の増加路の長さ (limit) が分かったら, それより深い層は作らない.
+            limit = M + 1
+            for a in Q:
+                if dist[a] >= limit:
+                    break
+
+                next_dist = dist[a] + 1
+                for b in target[offset[a]: offset[a + 1]]:
+                    c = q[b]
+                    if c == -1:
+                        limit = next_dist
+                    elif dist[c] == -1:
+                        dist[c] = next_dist
+                        Q.append(c)
+
+            if limit == M + 1:
+                break
+
+            # DFS で, 層に沿って増加路を探す.
+            it = list(offset)
+            for x in range(M):
+                if p[x] != -1 or dist[x] != 0:
+                    continue
 
-        if not matching:
-            self.__matching = None
+                stack = [x]
+                while stack:
+                    a = stack[-1]
+                    if it[a] == offset[a + 1]:
+                        dist[a] = -1
+                        stack.pop()
+                        continue
 
-        A = [-1] * self.M
-        B = [-1] * self.N
+                    c = q[target[it[a]]]
+                    if c == -1:
+                        for a in stack:
+                            b = target[it[a]]
+                            p[a] = b; q[b] = a
+                            dist[a] = -1
+                        size += 1
+                        break
 
-        for i in range(self.M):
-            if p[i] != -1:
-                A[i] = p[i]
-                B[p[i]] = i
+                    if dist[c] == dist[a] + 1:
+                        stack.append(c)
+                    else:
+                        it[a] += 1
 
-        self.__matching = (A, B)
+        return size
 
     @property
     def max_matching_size(self) -> int:
@@ -2,16 +2,73 @@
 #URL: https://atcoder.jp/contests/practice2/submissions/17017372
 
 from collections import deque
+from array import array
+
+class Residual_Graph:
+    """ 残余グラフを平行な配列で持つ.
+
+    弧 i の順方向の番号は 2i, 逆方向の番号は 2i + 1 であり, 互いの逆弧は e ^ 1 で求まる.
+    to[e] は弧 e の終点, cap[e] は弧 e の残余容量 (inf を許すためリストで持つ), base[i] は弧 i の容量である.
+    adjacent[v] は v を始点とする弧の番号の配列である.
+    """
+
+    __slots__ = ("adjacent", "to", "cap", "base")
+
+    def __init__(self, N: int = 0):
+        self.adjacent: list[array] = [array('q') for _ in range(N)]
+        self.to = array('q')
+        self.cap: list[int] = []
+        self.base: list[int] = []
+
+    def add_vertices(self, k: int):
+        self.adjacent.extend([array('q') for _ in range(k)])
+
+    def add_arc(self, v: int, w: int, cap: int) -> int:
+        m = len(self.base)
+        self.adjacent[v].append(2 * m)
+        self.adjacent[w].append(2 * m + 1)
+        self.to.append(w); self.to.append(v)
+        self.cap.append(cap); self.cap.append(0)
+        self.base.append(cap)
+        return m
 
 class Arc:
-    def __init__(self, source: int, target: int, cap: int, base: int, direction: int, id: int):
-        self.source = source
-        self.target = target
-        self.cap = cap
-        self.base = base
-        self.rev: Arc = None
-        self.direction = direction # 1 が順, -1 が逆順
-        self.id = id
+    """ 弧 (残余グラフの弧 index の view). 属性は残余グラフの現在の状態を読む. """
+
+    __slots__ = ("__graph", "__index")
+
+    def __init__(self, graph, index: int):
+        self.__graph = graph
+        self.__index = index
+
+    @property
+    def source(self) -> int:
+        return self.__graph.to[self.__index ^ 1]
+
+    @property
+    def target(self) -> int:
+        return self.__graph.to[self.__index]
+
+    @property
+    def cap(self) -> int:
+        return self.__graph.cap[self.__index]
+
+    @property
+    def base(self) -> int:
+        return self.__graph.base[self.__index >> 1]
+
+    @property
+    def rev(self) -> "Arc":
+        return Arc(self.__graph, self.__index ^ 1)
+
+    @property
+    def direction(self) -> int:
+        """ 1 が順, -1 が逆順 """
+        return -1 if self.__index & 1 else 1
+
+    @property
+    def id(self) -> int:
+        return self.__index >> 1
 
     def __repr__(self):
         return f"{self.__class__.__name__}(source={self.source}, target={self.target}, cap={self.cap}, base={self.base}, direction={self.direction}, id={self.id})"
@@ -26,8 +83,39 @@ class Max_Flow:
             N (int, optional): 位数. Defaults to 0.
         """
 
-        self.arc: list[list[Arc]] = [[] for _ in range(N)]
-        self.__arc_list: list[Arc] =[]
+        self.residual = Residual_Graph(N)
+
+    @classmethod
+    def from_arcs(cls, N: int, S, T, C) -> "Max_Flow":
+        """ 容量 C[j] の弧 S[j] -> T[j] からなる N 頂点の最大フローを, add_arc を呼ばずに一度に生成する.
+
+        Args:
+            N (int): 位数
+            S, T, C: 同じ長さの列 (Integer_Reader.read_columns の返り値など)
+
+        Returns:
+            Max_Flow: 弧 j の番号が j である最大フロー
+        """
+
+        F = cls(N)
+        R = F.residual
+        m = len(S)
+
+        # 弧 2j は S[j] -> T[j], 弧 2j + 1 はその逆弧.
+        to = array('q', bytes(16 * m))
+        to[0::2] = array('q', T); to[1::2] = array('q', S)
+
+        cap = [0] * (2 * m)
+        cap[0::2] = C
+
+        adjacent = R.adjacent
+        e = 0
+        for s, t in zip(S, T):
+            adjacent[s].append(e); adjacent[t].append(e + 1)
+            e += 2
+
+        R.to = to; R.cap = cap; R.base = list(C)
+        return F
 
     @property
     def order(self) -> int:
@@ -36,7 +124,7 @@ class Max_Flow:
         Returns:
             int: 位数
         """
-        return len(self.arc)
+        return len(self.residual.adjacent)
 
     @property
     def vertex_count(self) -> int:
@@ -45,7 +133,7 @@ class Max_Flow:
         Returns:
             int: 頂点数
         """
-        return len(self.arc)
+        return len(self.residual.adjacent)
 
     @property
     def size(self) -> int:
@@ -54,7 +142,7 @@ class Max_Flow:
         Returns:
             int: サイズ
         """
-        return len(self.__arc_list)
+        return len(self.residual.base)
 
     @property
     def arc_count(self):
@@ -63,7 +151,7 @@ class Max_Flow:
         Returns:
             int: 弧の数
         """
-        return len(self.__arc_list)
+        return len(self.residual.base)
 
     def add_vertex(self) -> int:
         """ 頂点を 1 個追加する.
@@ -72,7 +160,7 @@ class Max_Flow:
             int: 追加した頂点の番号
         """
 
-        self.arc.append([])
+        self.residual.add_vertices(1)
         return self.vertex_count - 1
 
     def add_vertices(self, k: int) -> int:
@@ -86,7 +174,7 @@ class Max_Flow:
         """
 
         n = self.vertex_count
-        self.arc.extend([[] for _ in range(k)])
+        self.residual.add_vertices(k)
         return list(range(n, n + k))
 
     def add_arc(self, v: int, w: int, cap: int) -> int:
@@ -101,17 +189,7 @@ class Max_Flow:
             int: 追加した弧の番号
         """
 
-
-        m = self.size
-        arc = Arc(v, w, cap, cap, 1, m)
-        arc_rev = Arc(w, v, 0, cap, -1, m)
-        arc.rev = arc_rev
-        arc_rev.rev = arc
-        self.arc[v].append(arc)
-        self.arc[w].append(arc_rev)
-        self.__arc_list.append(arc)
-
-        return m
+        return self.residual.add_arc(v, w, cap)
 
     def get_arc(self, i: int) -> Arc:
         """ i 番目の弧を得る.
@@ -120,11 +198,11 @@ class Max_Flow:
             i (int): 弧の番号
 
         Returns:
-            Arc: 弧
+            Arc: 弧 (残余グラフの view)
         """
 
         assert 0 <= i < self.size
-        return self.__arc_list[i]
+        return Arc(self.residual, 2 * i)
 
     def get_all_arcs(self) -> list[Arc]:
         return [self.get_arc(i) for i in range(self.size)]
@@ -137,9 +215,10 @@ class Max_Flow:
         assert 0 <= i < self.size
         assert 0 <= new_flow<=new_cap
 
-        a=self.__arc_list[i]
-        a.base=new_cap; a.cap=new_cap-new_flow
-        a.rev.base=new_cap; a.rev.cap=new_flow
+        R = self.residual
+        R.base[i] = new_cap
+        R.cap[2 * i] = new_cap - new_flow
+        R.cap[2 * i + 1] = new_flow
 
     def add_edge(self, v, w, cap):
         """ 容量 cap の無向辺 v → w を加える."""
@@ -147,46 +226,49 @@ class Max_Flow:
         self.add_arc(w,v,cap)
 
     def __bfs(self, s: int, t: int) -> bool:
+        adjacent = self.residual.adjacent; to = self.residual.to; cap = self.residual.cap
         level = self.level = [-1] * self.vertex_count
         Q = deque([s])
         level[s] = 0
         while Q:
             v = Q.popleft()
             next_level = level[v] + 1
-            for arc in self.arc[v]:
-                if not(arc.cap and level[arc.target] == -1):
+            for e in adjacent[v]:
+                w = to[e]
+                if not(cap[e] and level[w] == -1):
                     continue
 
-                level[arc.target] = next_level
-                if arc.target == t:
+                level[w] = next_level
+                if w == t:
                     return True
 
-                Q.append(arc.target)
+                Q.append(w)
 
         return False
 
     def __dfs(self, s: int, t: int, up: int) -> int:
-        arc_to = self.arc
+        adjacent = self.residual.adjacent; to = self.residual.to; cap = self.residual.cap
         it = self.it
         level = self.level
 
-        st = deque([t])
+        # t から s へ, 逆弧を辿って探索する (v に入る弧は e ^ 1).
+        st = [t]
         while st:
             v = st[-1]
             if v == s:
                 break
 
             lv = level[v]-1
-            while it[v] < len(arc_to[v]):
-                arc_rev = arc_to[v][it[v]]
-                arc = arc_rev.rev
-                if arc.cap == 0 or lv != level[arc.source]:
+            adj_v = adjacent[v]
+            while it[v] < len(adj_v):
+                e = adj_v[it[v]]
+                if cap[e ^ 1] == 0 or lv != level[to[e]]:
                     it[v] += 1
                     continue
-                st.append(arc.source)
+                st.append(to[e])
                 break
 
-            if it[v] == len(arc_to[v]):
+            if it[v] == len(adj_v):
                 st.pop()
                 level[v] = -1
         else:
@@ -195,13 +277,13 @@ class Max_Flow:
         st.pop()
         flow = up
         for w in st:
-            arc = arc_to[w][it[w]].rev
-            flow = min(flow, arc.cap)
+            e = adjacent[w][it[w]]
+            flow = min(flow, cap[e ^ 1])
 
         for w in st:
-            arc_rev = arc_to[w][it[w]]
-            arc_rev.cap += flow
-            arc_rev.rev.cap -= flow
+            e = adjacent[w][it[w]]
+            cap[e] += flow
+            cap[e ^ 1] -= flow
 
         return flow
 
@@ -228,9 +310,10 @@ class Max_Flow:
         return flow
 
     def get_flow(self) -> list[list[tuple[int, int, int]]]:
+        R = self.residual
         F = [[] for _ in range(self.vertex_count)]
-        for arc in self.__arc_list:
-            F[arc.source].append((arc.id, arc.target, arc.base - arc.cap))
+        for i in range(self.size):
+            F[R.to[2 * i + 1]].append((i, R.to[2 * i], R.base[i] - R.cap[2 * i]))
         return F
 
     def min_cut(self, s: int) -> list[int]:
@@ -243,17 +326,456 @@ class Max_Flow:
             list[int]: 0, 1 からなる長さが位数のリスト. 最小カットは 0 側と 1 側に分かれる. 頂点 s は必ず 0 側になる.
         """
 
+        adjacent = self.residual.adjacent; to = self.residual.to; cap = self.residual.cap
         group = [1] * self.vertex_count
-        Q = deque([s])
+        Q = [s]
         while Q:
             v = Q.pop()
             group[v] = 0
-            for arc in self.arc[v]:
-                if arc.cap and group[arc.target]:
-                    Q.append(arc.target)
+            for e in adjacent[v]:
+                if cap[e] and group[to[e]]:
+                    Q.append(to[e])
+        return group
+
+    def refresh(self):
+        R = self.residual
+        for i in range(self.size):
+            R.cap[2 * i] = R.base[i]
+            R.cap[2 * i + 1] = 0
+
+    def __net_out(self, v: int) -> int:
+        """ v から出る正味の流量 """
+
+        R = self.residual
+        flow = 0
+        for e in R.adjacent[v]:
+            if e & 1:
+                flow -= R.cap[e]
+            else:
+                flow += R.base[e >> 1] - R.cap[e]
+        return flow
+
+    def __set_capacity(self, i: int, new_cap: int, source: int, target: int):
+        """ i 番目の弧の容量を new_cap にし, 流量が容量を超える場合はその超過分を付け替える (又は打ち消す). """
+
+        R = self.residual
+        flow = R.base[i] - R.cap[2 * i]
+        R.base[i] = new_cap
+        if flow <= new_cap:
+            R.cap[2 * i] = new_cap - flow
+            return
+
+        excess = flow - new_cap
+        R.cap[2 * i] = 0; R.cap[2 * i + 1] = new_cap
+
+        # u に excess だけ超過, w に excess だけ不足が生じる (u, w が source, target ならば問題ない).
+        u = R.to[2 * i + 1]; w = R.to[2 * i]
+        if u == w:
+            return
+
+        fix_u = u != source and u != target
+        fix_w = w != source and w != target
+        if not(fix_u or fix_w):
+            return
+
+        # まず, u から w へ迂回させる.
+        rest = excess - self.max_flow(u, w, excess)
+        if rest == 0:
+            return
+
+        # 迂回できない分は, u の超過を source (又は target) に戻し, w の不足を target (又は source) から補う.
+        if fix_u:
+            x = self.max_flow(u, source, rest)
+            if x < rest:
+                self.max_flow(u, target, rest - x)
+
+        if fix_w:
+            x = self.max_flow(target, w, rest)
+            if x < rest:
+                self.max_flow(source, w, rest - x)
+
+    def update_capacities(self, changes, source: int, target: int) -> int:
+        """ 各 (i, new_cap) について i 番目の弧の容量を new_cap に変更し, source から target への最大流に修復する.
+
+        現在のフローが source から target への最大流であることを仮定する.
+        容量が減って流量が容量を超えた弧は, 超過分を迂回させ, 迂回できない分を打ち消す. その後, 増加路を流し直す.
+
+        Args:
+            changes: (弧の番号, 新しい容量) の列
+            source (int): 始点
+            target (int): 終点
+
+        Returns:
+            int: 流量の変化量 (負もあり得る)
+        """
+
+        before = self.__net_out(source)
+        for i, new_cap in changes:
+            assert 0 <= i < self.size and 0 <= new_cap
+            self.__set_capacity(i, new_cap, source, target)
+
+        self.max_flow(source, target)
+        return self.__net_out(source) - before
+
+    def update_capacity(self, i: int, new_cap: int, source: int, target: int) -> int:
+        """ i 番目の弧の容量を new_cap に変更し, source から target への最大流に修復する.
+
+        Returns:
+            int: 流量の変化量 (負もあり得る)
+        """
+
+        return self.update_capacities([(i, new_cap)], source, target)
+
+class Max_Flow_HLPP:
+    """ Highest-Label Push-Relabel 法 (gap, global relabel 付き) による最大フロー.
+
+    Max_Flow と同じインターフェースを持つ. 弧は平坦な配列 (to, cap, next) で持ち, 弧 i の順方向は 2i, 逆方向は 2i + 1 である.
+    """
+
+    inf = float("inf")
+
+    def __init__(self, N: int = 0):
+        """ N 頂点の最大フローを用意する.
+
+        Args:
+            N (int, optional): 位数. Defaults to 0.
+        """
+
+        self.head: list[int] = [-1] * N
+        self.next: list[int] = []
+        self.to: list[int] = []
+        self.cap: list[int] = []
+        self.base: list[int] = []
+
+    @property
+    def order(self) -> int:
+        return len(self.head)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.head)
+
+    @property
+    def size(self) -> int:
+        return len(self.base)
+
+    @property
+    def arc_count(self):
+        return len(self.base)
+
+    def add_vertex(self) -> int:
+        """ 頂点を 1 個追加する.
+
+        Returns:
+            int: 追加した頂点の番号
+        """
+
+        self.head.append(-1)
+        return self.vertex_count - 1
+
+    def add_vertices(self, k: int) -> int:
+        """ 頂点を k 個追加する.
+
+        Args:
+            k (int): 追加する頂点の数
+
+        Returns:
+            int: 追加する k 個の頂点の番号からなるリスト
+        """
+
+        n = self.vertex_count
+        self.head.extend([-1] * k)
+        return list(range(n, n + k))
+
+    def __push_arc(self, v: int, w: int, cap: int):
+        self.to.append(w); self.cap.append(cap)
+        self.next.append(self.head[v]); self.head[v] = len(self.to) - 1
+
+    def add_arc(self, v: int, w: int, cap: int) -> int:
+        """ 容量 cap の弧 v → w を追加する.
+
+        Args:
+            v (int): 始点
+            w (int): 終点
+            cap (int): 容量
+
+        Returns:
+            int: 追加した弧の番号
+        """
+
+        m = self.size
+        self.__push_arc(v, w, cap)
+        self.__push_arc(w, v, 0)
+        self.base.append(cap)
+        return m
+
+    def __pop_arc(self):
+        """ 最後に追加した弧を削除する. """
+
+        e = len(self.to) - 2
+        v = self.to[e + 1]; w = self.to[e]
+        self.head[v] = self.next[e]
+        self.head[w] = self.next[e + 1]
+        del self.to[-2:], self.cap[-2:], self.next[-2:]
+        self.base.pop()
+
+    def get_arc(self, i: int) -> Arc:
+        """ i 番目の弧を得る.
+
+        Args:
+            i (int): 弧の番号
+
+        Returns:
+            Arc: 弧 (view)
+        """
+
+        assert 0 <= i < self.size
+        return Arc(self, 2 * i)
+
+    def get_all_arcs(self) -> list[Arc]:
+        return [self.get_arc(i) for i in range(self.size)]
+
+    def change_arc(self, i, new_cap, new_flow):
+        """ i 番目の辺の情報を変更する.
+
+        """
+
+        assert 0 <= i < self.size
+        assert 0 <= new_flow <= new_cap
+
+        self.base[i] = new_cap
+        self.cap[2 * i] = new_cap - new_flow
+        self.cap[2 * i + 1] = new_flow
+
+    def add_edge(self, v, w, cap):
+        """ 容量 cap の無向辺 v → w を加える."""
+        self.add_arc(v, w, cap)
+        self.add_arc(w, v, cap)
+
+    def __csr(self, n: int):
+        """ 各頂点から出る弧の番号を CSR 形式で並べる. """
+
+        head = self.head; next = self.next
+        start = [0] * (n + 1)
+        arcs = []
+        for v in range(n):
+            e = head[v]
+            while e != -1:
+                arcs.append(e)
+                e = next[e]
+            start[v + 1] = len(arcs)
+        return start, arcs
+
+    def __discharge_all(self, n: int, sink: int, fixed: int, start: list[int], arcs: list[int], excess: list):
+        """ sink 以外で高さ n 未満の活性頂点がなくなるまで, 最高ラベルの頂点から押し出す.
+
+        fixed は高さを n に固定する頂点 (始点) である.
+        """
+
+        to = self.to; cap = self.cap
+
+        height = [n] * n
+        it = start[:n]
+        active = [[] for _ in range(n)]
+        # members[h]: 高さ h になった頂点 (その後に高さが変わった頂点も残るので, 使うときに高さを確かめる)
+        members = [[] for _ in range(n)]
+        count = [0] * (n + 1)
+        top = 0 # 高さが n 未満の頂点の高さの最大値 (以上)
+
+        def global_relabel():
+            """ 残余グラフで sink への距離を高さとし, 活性頂点のバケットを作り直す. """
+
+            nonlocal top
+
+            for h in range(n):
+                active[h].clear()
+                members[h].clear()
+            for v in range(n):
+                height[v] = n
+            height[sink] = 0
+
+            queue = [sink]
+            for x in queue:
+                hx = height[x] + 1
+                for e in arcs[start[x]: start[x + 1]]:
+                    v = to[e]
+                    if height[v] == n and cap[e ^ 1] > 0 and v != fixed:
+                        height[v] = hx
+                        queue.append(v)
+
+            for h in range(n + 1):
+                count[h] = 0
+
+            highest = 0
+            top = height[queue[-1]]
+            for v in queue:
+                count[height[v]] += 1
+                members[height[v]].append(v)
+                it[v] = start[v]
+                if excess[v] > 0 and v != sink:
+                    active[height[v]].append(v)
+                    if height[v] > highest:
+                        highest = height[v]
+            return highest
+
+        highest = global_relabel()
+        work = 0
+        relabel_interval = 6 * n + len(arcs)
+
+        while highest >= 0:
+            if not active[highest]:
+                highest -= 1
+                continue
+
+            v = active[highest].pop()
+            if height[v] != highest or excess[v] <= 0:
+                continue
+
+            h = highest
+            ex = excess[v]
+            i = it[v]; end = start[v + 1]
+            while True:
+                if i == end:
+                    # relabel
+                    new_h = n
+                    for e in arcs[start[v]: end]:
+                        if cap[e] > 0 and height[to[e]] < new_h:
+                            new_h = height[to[e]]
+                    new_h += 1
+
+                    work += end - start[v] + 12
+                    count[h] -= 1
+                    if count[h] == 0:
+                        # gap: 高さが h より大きい頂点は sink に到達できない.
+                        for hh in range(h + 1, top + 1):
+                            for w in members[hh]:
+                                if height[w] == hh:
+                                    height[w] = n
+                            count[hh] = 0
+                            members[hh].clear()
+                            active[hh].clear()
+                        top = h - 1
+                        new_h = n
+
+                    if new_h >= n:
+                        height[v] = n
+                        break
+
+                    height[v] = h = new_h
+                    count[h] += 1
+                    members[h].append(v)
+                    if top < h:
+                        top = h
+                    i = start[v]
+                    continue
+
+                e = arcs[i]
+                w = to[e]
+                c = cap[e]
+                if c > 0 and height[w] + 1 == h:
+                    d = ex if ex < c else c
+                    cap[e] = c - d; cap[e ^ 1] += d
+                    ex -= d
+                    if excess[w] == 0 and w != sink and w != fixed:
+                        active[h - 1].append(w)
+                        if highest < h - 1:
+                            highest = h - 1
+                    excess[w] += d
+                    if ex == 0:
+                        break
+                i += 1
+
+            # v は超過量を全て押し出したか, sink に到達できなくなった.
+            excess[v] = ex
+            it[v] = i
+
+            if work >= relabel_interval:
+                work = 0
+                highest = global_relabel()
+
+        return height
+
+    def max_flow(self, source: int, target: int, flow_limit: int = inf) -> int:
+        """ source から target へ flow_limit を上限として流せるだけ流したときの "追加で発生する" 流量を求める.
+
+        Args:
+            source (int): 始点
+            target (int): 終点
+            flow_limit (int, optional): 流量の上限. Defaults to inf.
+
+        Returns:
+            int: "追加で発生する" 流量
+        """
+
+        if source == target:
+            return 0
+
+        # 流量の上限がある場合, 容量 flow_limit の弧を持つ仮想の始点を用意する.
+        limited = flow_limit < Max_Flow_HLPP.inf
+        if limited:
+            self.head.append(-1)
+            s = self.vertex_count - 1
+            self.add_arc(s, source, flow_limit)
+        else:
+            s = source
+
+        n = self.vertex_count
+        start, arcs = self.__csr(n)
+        to = self.to; cap = self.cap
+
+        excess = [0] * n
+        for j in range(start[s], start[s + 1]):
+            e = arcs[j]
+            d = cap[e]
+            if d > 0:
+                cap[e] = 0; cap[e ^ 1] += d
+                excess[to[e]] += d
+                excess[s] -= d
+
+        # 第 1 段階: target へ流せるだけ流す (最大プリフロー).
+        self.__discharge_all(n, target, s, start, arcs, excess)
+        flow = excess[target]
+
+        # 第 2 段階: 残った超過量を始点へ戻す.
+        self.__discharge_all(n, s, target, start, arcs, excess)
+
+        if limited:
+            self.__pop_arc()
+            self.head.pop()
+
+        return flow
+
+    def get_flow(self) -> list[list[tuple[int, int, int]]]:
+        F = [[] for _ in range(self.vertex_count)]
+        for i in range(self.size):
+            F[self.to[2 * i + 1]].append((i, self.to[2 * i], self.base[i] - self.cap[2 * i]))
+        return F
+
+    def min_cut(self, s: int) -> list[int]:
+        """ s を 0 側に含める最小カットを求める.
+
+        Args:
+            s (int): 頂点番号
+
+        Returns:
+            list[int]: 0, 1 からなる長さが位数のリスト. 最小カットは 0 側と 1 側に分かれる. 頂点 s は必ず 0 側になる.
+        """
+
+        head = self.head; next = self.next; to = self.to; cap = self.cap
+        group = [1] * self.vertex_count
+        group[s] = 0
+        stack = [s]
+        while stack:
+            v = stack.pop()
+            e = head[v]
+            while e != -1:
+                if cap[e] and group[to[e]]:
+                    group[to[e]] = 0
+                    stack.append(to[e])
+                e = next[e]
         return group
 
     def refresh(self):
-        for a in self.__arc_list:
-            a.cap = a.base
-            a.rev.cap = 0
+        for i in range(self.size):
+            self.cap[2 * i] = self.base[i]
+            self.cap[2 * i + 1] = 0
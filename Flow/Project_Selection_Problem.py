@@ -233,10 +233,13 @@ class Project_Selection_Problem:
 
         self.increase(X[::-1])
 
-    def solve(self):
-        """ Project Selection Problem を解く. """
+    def solve(self, engine = Max_Flow):
+        """ Project Selection Problem を解く.
 
-        F = Max_Flow(self.ver_num)
+        engine: 最小カットを求める最大フローのクラス (Max_Flow (Dinic 法) または Max_Flow_HLPP)
+        """
+
+        F = engine(self.ver_num)
         base= self.base
         for i in range(self.N):
             F.add_arc(self.source, i, 0)
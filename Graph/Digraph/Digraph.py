@@ -1,3 +1,5 @@
+from itertools import repeat
+
 class Digraph:
     """重み[なし]有向グラフを生成する.
 
@@ -36,6 +38,26 @@ class Digraph:
         self.adjacent_in[target].append((source, label))
         self.__size += 1
 
+    #弧をまとめて追加したグラフ
+    @classmethod
+    def from_arcs(cls, N, S, T, label = None):
+        """ 弧 S[j] -> T[j] (ラベルは label[j]) からなる N 頂点の有向グラフを, add_arc を呼ばずに一度に生成する.
+
+        S, T, label: 同じ長さの列 (Integer_Reader.read_columns の返り値など). label が None ならば全て None.
+        """
+
+        D = cls(N)
+        adjacent_out = D.adjacent_out; adjacent_in = D.adjacent_in
+        if label is None:
+            label = repeat(None)
+
+        for s, t, l in zip(S, T, label):
+            adjacent_out[s].append((t, l))
+            adjacent_in[t].append((s, l))
+
+        D.__size = len(S)
+        return D
+
     #Walkの追加
     def add_walk(self,*walk):
         """ 有向歩道 walk=(w[0], ..., w[n-1]) を追加する. """
@@ -145,7 +167,7 @@ class Digraph:
         Q = deque([u])
         while Q:
             x = Q.popleft()
-            for y in self.in_partner_yield(x):
+            for y in self.out_partner_yield(x):
                 if dist[y] != -1:
                     continue
 
@@ -169,7 +191,7 @@ class Digraph:
         Q = deque([u])
         while Q:
             x = Q.popleft()
-            for y in self.in_partner_yield(x):
+            for y in self.out_partner_yield(x):
                 if dist[y] != -1:
                     continue
 
@@ -214,6 +236,244 @@ class Digraph:
         else:
             return { 'vertex': None, 'arc': None }
 
+    def freeze(self, reverse = True):
+        """ CSR 形式で保持された変更不可能な有向グラフ (Frozen_Digraph) を生成する.
+
+        reverse: False にすると, 入近傍の情報を持たない (メモリ使用量が半分程度になる).
+        """
+
+        from array import array
+
+        N = self.order()
+
+        def build(adjacent):
+            offset = array('q', [0]) * (N + 1)
+            for v in range(N):
+                offset[v + 1] = offset[v] + len(adjacent[v])
+
+            partner = array('i', [w for A in adjacent for w, _ in A])
+
+            # ラベルが全て None ならば, ラベルの列は持たない.
+            if all(label is None for A in adjacent for _, label in A):
+                label = None
+            else:
+                label = [label for A in adjacent for _, label in A]
+            return offset, partner, label
+
+        out_offset, out_target, out_label = build(self.adjacent_out)
+        if reverse:
+            in_offset, in_source, in_label = build(self.adjacent_in)
+        else:
+            in_offset = in_source = in_label = None
+
+        return Frozen_Digraph(out_offset, out_target, out_label, in_offset, in_source, in_label, self.__size)
+
+#================================================
+# CSR 形式
+#================================================
+class CSR_Adjacent:
+    """ CSR 形式の隣接リストを, 頂点 v ごとに各列の組を yield するリストのように見せる. """
+
+    __slots__ = ("offset", "columns")
+
+    def __init__(self, offset, *columns):
+        self.offset = offset
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.offset) - 1
+
+    def __getitem__(self, v):
+        a = self.offset[v]; b = self.offset[v + 1]
+        return zip(*[column[a: b] if column is not None else repeat(None, b - a) for column in self.columns])
+
+class Frozen_Digraph:
+    """ CSR 形式で保持された変更不可能な有向グラフ (Digraph.freeze() で生成する).
+
+    頂点 v の出近傍は out_target[out_offset[v]: out_offset[v + 1]], 入近傍は in_source[in_offset[v]: in_offset[v + 1]] である.
+    ラベルは out_label, in_label の同じ位置にある (None のときは全て None).
+    """
+
+    __slots__ = ("out_offset", "out_target", "out_label", "in_offset", "in_source", "in_label", "__size")
+
+    def __init__(self, out_offset, out_target, out_label, in_offset, in_source, in_label, size):
+        self.out_offset = out_offset
+        self.out_target = out_target
+        self.out_label = out_label
+        self.in_offset = in_offset
+        self.in_source = in_source
+        self.in_label = in_label
+        self.__size = size
+
+    @property
+    def adjacent_out(self):
+        return CSR_Adjacent(self.out_offset, self.out_target, self.out_label)
+
+    @property
+    def adjacent_in(self):
+        assert self.in_offset is not None, "入近傍の情報を持っていません (reverse=True で freeze してください)."
+        return CSR_Adjacent(self.in_offset, self.in_source, self.in_label)
+
+    def has_reverse(self):
+        return self.in_offset is not None
+
+    #近傍
+    def out_partner_yield(self, v):
+        yield from self.out_target[self.out_offset[v]: self.out_offset[v + 1]]
+
+    def out_partner_with_label_yield(self, v):
+        yield from self.adjacent_out[v]
+
+    def in_partner_yield(self, v):
+        assert self.has_reverse()
+        yield from self.in_source[self.in_offset[v]: self.in_offset[v + 1]]
+
+    def in_partner_with_label_yield(self, v):
+        yield from self.adjacent_in[v]
+
+    #次数
+    def out_degree(self, v):
+        return self.out_offset[v + 1] - self.out_offset[v]
+
+    def in_degree(self, v):
+        assert self.has_reverse()
+        return self.in_offset[v + 1] - self.in_offset[v]
+
+    def degree(self, v):
+        return (self.out_degree(v), self.in_degree(v))
+
+    def relative_degree(self, v):
+        return self.out_degree(v) - self.in_degree(v)
+
+    def vertex_count(self):
+        """ グラフの頂点数 (位数) を求める."""
+        return len(self.out_offset) - 1
+
+    def order(self):
+        """ グラフの位数 (頂点数) を求める."""
+        return len(self.out_offset) - 1
+
+    def arc_count(self):
+        """ グラフの辺数 (サイズ) を求める."""
+        return self.__size
+
+    def size(self):
+        """ グラフのサイズ (辺数) を求める. """
+        return self.__size
+
+    def __search(self, v, offset, partner):
+        reach = [0] * self.order(); reach[v] = 1
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            for y in partner[offset[x]: offset[x + 1]]:
+                if not reach[y]:
+                    reach[y] = 1
+                    stack.append(y)
+
+        return [x for x in range(self.order()) if reach[x]]
+
+    def reachable_to(self, v):
+        """ 頂点 v に到達可能な頂点を求める. """
+        assert self.has_reverse()
+        return self.__search(v, self.in_offset, self.in_source)
+
+    def reachable_from(self, v):
+        """ 頂点 v から到達可能な頂点を求める. """
+        return self.__search(v, self.out_offset, self.out_target)
+
+    def distance(self, u, v, default = -1):
+        d = self.distance_all(u)[v]
+        return d if d != -1 else default
+
+    def distance_all(self, u, default = -1):
+        """ 頂点 u からの距離をそれぞれの頂点について求める."""
+
+        offset = self.out_offset; target = self.out_target
+
+        dist = [-1] * self.order(); dist[u] = 0
+        queue = [u]
+        for x in queue:
+            dx = dist[x] + 1
+            for y in target[offset[x]: offset[x + 1]]:
+                if dist[y] == -1:
+                    dist[y] = dx
+                    queue.append(y)
+
+        if default == -1:
+            return dist
+        return [d if d != -1 else default for d in dist]
+
+def Strongly_Connected_Components_CSR(N, offset, target):
+    """ CSR 形式の有向グラフを, 非再帰の Tarjan 法 (Pearce による省メモリ版) で強連結成分に分解する.
+
+    N: 頂点数
+    offset, target: v の出近傍が target[offset[v]: offset[v + 1]] になる列
+
+    返り値は (group, k) であり, group[v] は v が属する強連結成分の番号, k は強連結成分の個数である.
+    成分の番号はトポロジカル順である (u から v への弧があれば group[u] <= group[v]).
+    """
+
+    from array import array
+
+    # Pearce の方法: rindex[v] は訪問中は訪問順 (low link を兼ねる), 成分の確定後は c (N - 1 から減少) になる. 0 は未訪問を表す.
+    rindex = array('i', [0]) * N
+    root = bytearray(N)
+    it = offset[:N]
+
+    stack = []; call = []
+    index = 1; c = N - 1
+    for s in range(N):
+        if rindex[s]:
+            continue
+
+        rindex[s] = index; index += 1; root[s] = 1
+        call.append(s)
+        while call:
+            v = call[-1]
+            i = it[v]; end = offset[v + 1]
+            rv = rindex[v]
+            while i < end:
+                w = target[i]; i += 1
+                rw = rindex[w]
+                if rw == 0:
+                    break
+
+                if rw < rv:
+                    rv = rw; root[v] = 0
+            else:
+                # v の探索を終える.
+                rindex[v] = rv
+                call.pop()
+                if root[v]:
+                    index -= 1
+                    while stack and rv <= rindex[stack[-1]]:
+                        rindex[stack.pop()] = c
+                        index -= 1
+                    rindex[v] = c
+                    c -= 1
+                else:
+                    stack.append(v)
+
+                if call:
+                    u = call[-1]
+                    if rindex[v] < rindex[u]:
+                        rindex[u] = rindex[v]; root[u] = 0
+                continue
+
+            # w に潜る.
+            rindex[v] = rv
+            it[v] = i
+            rindex[w] = index; index += 1; root[w] = 1
+            call.append(w)
+
+    # 成分はトポロジカル順の逆順に確定するので, c + 1 を引くとトポロジカル順の番号になる.
+    k = N - 1 - c
+    for v in range(N):
+        rindex[v] -= c + 1
+
+    return rindex, k
+
 #================================================
 #Dijkstra
 def One_Point_Distance(D, From, with_path=False):
@@ -353,9 +613,9 @@ def Is_Directed_Acyclic_Graph(D):
 def Cycle_Reduction(D):
     C=Strongly_Connected_Component_Decomposition(D,1)
 
-    E=Digraph(max(C)+1)
+    E=Digraph(max(C, default=-1)+1)
     for v in range(D.vertex_count()):
-        for w in D.adjacent_out[v]:
+        for w in D.out_partner_yield(v):
             if C[v]!=C[w]:
                 E.add_arc(C[v],C[w])
     return E
@@ -372,48 +632,10 @@ def Strongly_Connected_Component_Decomposition(D,Mode=0):
     ※0で帰ってくるリストは各強連結成分に関してトポロジカルソートである.
     """
 
-    N=D.vertex_count()
-    Group=[0]*N
-    Order=[]
-    adj_out=D.adjacent_out; adj_in=D.adjacent_in
-
-    for v in range(N):
-        if Group[v]==-1:
-            continue
-
-        S=[v]
-        Group[v]=-1
-
-        while S:
-            u=S.pop()
-            for w in adj_out[u]:
-                if Group[w]:
-                    continue
-
-                Group[w]=-1
-                S.append(u)
-                S.append(w)
-                break
-            else:
-                Order.append(u)
-
-    k=0
-    for v in Order[::-1]:
-        if Group[v]!=-1:
-            continue
-
-        S=[v]
-        Group[v]=k
-
-        while S:
-            u=S.pop()
-            for w in adj_in[u]:
-                if Group[w]!=-1:
-                    continue
-
-                Group[w]=k
-                S.append(w)
-        k+=1
+    F=D if isinstance(D, Frozen_Digraph) else D.freeze(reverse=False)
+    N=F.vertex_count()
+    Group,k=Strongly_Connected_Components_CSR(N, F.out_offset, F.out_target)
+    Group=list(Group)
 
     if Mode==0 or Mode==2:
         T=[[] for _ in range(k)]
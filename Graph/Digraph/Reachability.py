@@ -0,0 +1,119 @@
+from Digraph import *
+
+def Condensation_Successors(D):
+    """ 有向グラフ D を強連結成分に分解し, 縮約した DAG の出近傍を求める.
+
+    返り値は (group, k, successors) であり, group[v] は v が属する強連結成分の番号 (トポロジカル順), k は強連結成分の個数,
+    successors[c] は成分 c から弧が出ている成分のリスト (重複なし, 全て c より大きい) である.
+    """
+
+    F = D if isinstance(D, Frozen_Digraph) else D.freeze(reverse = False)
+    N = F.vertex_count()
+    offset = F.out_offset; target = F.out_target
+
+    group, k = Strongly_Connected_Components_CSR(N, offset, target)
+
+    successors = [[] for _ in range(k)]
+    seen = [-1] * k
+
+    # 同じ成分の頂点を続けて走査する.
+    for v in sorted(range(N), key = group.__getitem__):
+        c = group[v]
+        succ_c = successors[c]
+        for i in range(offset[v], offset[v + 1]):
+            d = group[target[i]]
+            if d != c and seen[d] != c:
+                seen[d] = c
+                succ_c.append(d)
+
+    return group, k, successors
+
+class Reachability_Index:
+    """ 有向グラフの到達可能性を O(1) で判定するための索引.
+
+    強連結成分を縮約した DAG 上で, 各成分から到達可能な成分の集合を多倍長整数のビット列として, トポロジカル順の逆順に求める.
+    成分 c のビット列は c 以上の成分しか含まないので, c ビット右にずらして持つ.
+    求めた後は, 判定で多倍長整数をずらさずに済むように, ビット列をバイト列 (リトルエンディアン) に変換して持つ.
+    メモリは (成分数)^2 / 16 バイト程度必要なので, 成分数が大きい場合は Reachable_Many を用いる.
+    """
+
+    __slots__ = ("group", "k", "__closure", "__count")
+
+    def __init__(self, D):
+        """ D: 有向グラフ (Digraph, Frozen_Digraph) """
+
+        group, k, successors = Condensation_Successors(D)
+        self.group = group
+        self.k = k
+
+        closure = [0] * k
+        for c in range(k - 1, -1, -1):
+            x = 1
+            for d in successors[c]:
+                x |= closure[d] << (d - c)
+            closure[c] = x
+
+        count = [0] * k
+        for c in range(k):
+            x = closure[c]
+            count[c] = x.bit_count()
+            closure[c] = x.to_bytes((x.bit_length() + 7) >> 3, "little")
+
+        self.__closure = closure
+        self.__count = count
+
+    def reachable(self, u, v):
+        """ 頂点 u から頂点 v へ到達可能か? """
+
+        c = self.group[u]; d = self.group[v]
+        if d < c:
+            return False
+
+        s = d - c
+        b = self.__closure[c]
+        return (s >> 3) < len(b) and (b[s >> 3] >> (s & 7)) & 1 == 1
+
+    def reachable_count(self, u):
+        """ 頂点 u から到達可能な強連結成分の個数 (u の成分自身を含む). """
+
+        return self.__count[self.group[u]]
+
+def Reachable_Many(D, pairs, chunk = 1 << 12):
+    """ 有向グラフ D について, pairs の各 (u, v) に対して u から v へ到達可能かを先読みで判定する.
+
+    到達先の成分を chunk 個ずつに分け, それぞれについて各成分から到達可能な (その範囲の) 成分のビット列を求める.
+    メモリは O(成分数 * chunk / 8) バイトで済む.
+
+    返り値の i 番目は pairs[i] の答え (bool) である.
+    """
+
+    group, k, successors = Condensation_Successors(D)
+
+    pairs = list(pairs)
+    ans = [False] * len(pairs)
+
+    # 到達先の成分の chunk ごとにクエリを分ける.
+    queries = [[] for _ in range((k + chunk - 1) // chunk)]
+    for i, (u, v) in enumerate(pairs):
+        c = group[u]; d = group[v]
+        if c <= d:
+            queries[d // chunk].append((i, c, d))
+
+    for j, Q in enumerate(queries):
+        if not Q:
+            continue
+
+        l = j * chunk; r = min(l + chunk, k)
+        # bits[c]: 成分 c から到達可能な [l, r) の成分 (d は d - l ビット目)
+        bits = [0] * r
+        for c in range(r - 1, -1, -1):
+            x = 1 << (c - l) if l <= c else 0
+            for d in successors[c]:
+                if d < r:
+                    x |= bits[d]
+            bits[c] = x
+
+        for i, c, d in Q:
+            ans[i] = (bits[c] >> (d - l)) & 1 == 1
+
+    return ans
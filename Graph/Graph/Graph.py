@@ -1,3 +1,5 @@
+from itertools import repeat
+
 class Graph:
     __slots__ = ("adjacent", "deg", "__size")
 
@@ -45,6 +47,28 @@ class Graph:
         self.deg[v] += 1
         self.__size += 1
 
+    #辺をまとめて追加したグラフ
+    @classmethod
+    def from_edges(cls, N, U, V, label = None):
+        """ 辺 U[j] V[j] (ラベルは label[j]) からなる N 頂点のグラフを, add_edge を呼ばずに一度に生成する.
+
+        U, V, label: 同じ長さの列 (Integer_Reader.read_columns の返り値など). label が None ならば全て None.
+        """
+
+        G = cls(N)
+        adjacent = G.adjacent; deg = G.deg
+        if label is None:
+            label = repeat(None)
+
+        for u, v, l in zip(U, V, label):
+            adjacent[u].append((v, l))
+            if u != v:
+                adjacent[v].append((u, l))
+            deg[u] += 1; deg[v] += 1
+
+        G.__size = len(U)
+        return G
+
     #Walkの追加
     def add_walk(self, *walk):
         """ walk=(w[0],...,w[n-1]) に対して, n-1 本の辺 w[i]w[i+1] を加える."""
@@ -203,13 +227,164 @@ class Graph:
                 if u <= v:
                     yield (u, v, label)
 
+    def freeze(self):
+        """ CSR 形式で保持された変更不可能なグラフ (Frozen_Graph) を生成する. """
+
+        from array import array
+
+        N = self.order()
+        offset = array('q', [0]) * (N + 1)
+        for v in range(N):
+            offset[v + 1] = offset[v] + len(self.adjacent[v])
+
+        target = array('i', [w for A in self.adjacent for w, _ in A])
+
+        # ラベルが全て None ならば, ラベルの列は持たない.
+        if all(label is None for A in self.adjacent for _, label in A):
+            label = None
+        else:
+            label = [label for A in self.adjacent for _, label in A]
+
+        return Frozen_Graph(offset, target, label, array('q', self.deg), self.__size)
+
+#==========
+# CSR 形式
+#==========
+class CSR_Adjacent:
+    """ CSR 形式の隣接リストを, 頂点 v ごとに各列の組を yield するリストのように見せる. """
+
+    __slots__ = ("offset", "columns")
+
+    def __init__(self, offset, *columns):
+        self.offset = offset
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.offset) - 1
+
+    def __getitem__(self, v):
+        a = self.offset[v]; b = self.offset[v + 1]
+        return zip(*[column[a: b] if column is not None else repeat(None, b - a) for column in self.columns])
+
+class Frozen_Graph:
+    """ CSR 形式で保持された変更不可能な無向グラフ (Graph.freeze() で生成する).
+
+    頂点 v の近傍は target[offset[v]: offset[v + 1]] であり, 対応する辺のラベルは label の同じ位置にある (label が None のときは全て None).
+    """
+
+    __slots__ = ("offset", "target", "label", "deg", "__size")
+
+    def __init__(self, offset, target, label, deg, size):
+        self.offset = offset
+        self.target = target
+        self.label = label
+        self.deg = deg
+        self.__size = size
+
+    @property
+    def adjacent(self):
+        return CSR_Adjacent(self.offset, self.target, self.label)
+
+    def partner_yield(self, v):
+        yield from self.target[self.offset[v]: self.offset[v + 1]]
+
+    def partner(self, v):
+        return self.target[self.offset[v]: self.offset[v + 1]].tolist()
+
+    def partner_with_label_yield(self, v):
+        yield from self.adjacent[v]
+
+    def neighborhood(self, v):
+        """ 頂点 v の近傍を求める. """
+        return set(self.partner_yield(v))
+
+    def degree(self, v):
+        """ 頂点 v の次数を求める. """
+        return self.deg[v]
+
+    def vertex_count(self):
+        """ グラフの頂点数 (位数) を出力する. """
+        return len(self.offset) - 1
+
+    def order(self):
+        """ グラフの位数 (頂点数) を出力する. """
+        return len(self.offset) - 1
+
+    def edge_count(self):
+        """ 辺の本数 (サイズ) を出力する."""
+        return self.__size
+
+    def size(self):
+        """ サイズ (辺の本数) を出力する. """
+        return self.__size
+
+    def connected_component(self, v):
+        """ 頂点 v を含む連結成分を出力する."""
+
+        offset = self.offset; target = self.target
+
+        comp = [0] * self.order(); comp[v] = 1
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            for y in target[offset[x]: offset[x + 1]]:
+                if comp[y] == 0:
+                    comp[y] = 1
+                    stack.append(y)
+
+        return [x for x in range(self.order()) if comp[x]]
+
+    def distance(self, u, v, default = -1):
+        """ 2頂点 u,v 間の距離を求める."""
+
+        d = self.distance_all(u)[v]
+        return d if d != -1 else default
+
+    def distance_all(self, u, default = -1):
+        """ 頂点 u からの距離を求める."""
+
+        offset = self.offset; target = self.target
+
+        dist = [-1] * self.order(); dist[u] = 0
+        queue = [u]
+        for x in queue:
+            dx = dist[x] + 1
+            for y in target[offset[x]: offset[x + 1]]:
+                if dist[y] == -1:
+                    dist[y] = dx
+                    queue.append(y)
+
+        if default == -1:
+            return dist
+        return [d if d != -1 else default for d in dist]
+
+    def edge_yielder(self):
+        for u in range(self.order()):
+            for v in self.partner_yield(u):
+                if u <= v:
+                    yield (u, v)
+
+    def edge_yielder_with_label(self):
+        for u in range(self.order()):
+            for v, label in self.partner_with_label_yield(u):
+                if u <= v:
+                    yield (u, v, label)
+
 #==========
 #グラフの生成
 #==========
 #補グラフの作成
 def Complement_Graph(G):
     """ グラフ G の補グラフを求める."""
-    pass
+
+    N = G.order()
+    H = Graph(N)
+    for u in range(N):
+        A = G.neighborhood(u)
+        for v in range(u + 1, N):
+            if v not in A:
+                H.add_edge(u, v)
+    return H
 
 # N 頂点のランダムグラフ
 def Random_Graph(N, p=0.5, self_loop=False, seed=None):
@@ -534,6 +709,193 @@ def Triangle(G: Graph, calc, merge, unit):
             used[k]=False
     return X
 
+# 退化順序
+def Degeneracy_Order(G: Graph):
+    """ 次数が最小の頂点を順に取り除いていく順序 (退化順序) を求める.
+
+    返り値は (order, k) であり, order は取り除いた順の頂点のリスト, k はグラフの退化度 (取り除いたときの次数の最大値) である.
+    各頂点 v について, order で v より後にある v の近傍は k 個以下である.
+
+    計算量: O(N + M)
+    """
+
+    N = G.order()
+    adj = [set(G.partner_yield(v)) for v in range(N)]
+    for v in range(N):
+        adj[v].discard(v)
+
+    deg = [len(adj[v]) for v in range(N)]
+    bucket = [[] for _ in range(max(deg, default = 0) + 1)]
+    for v in range(N):
+        bucket[deg[v]].append(v)
+
+    removed = [False] * N
+    order = []
+    k = 0; d = 0
+    while len(order) < N:
+        # 取り除くと近傍の次数は 1 しか減らないので, 最小次数は高々 1 しか減らない.
+        d = max(d - 1, 0)
+        while True:
+            while not bucket[d]:
+                d += 1
+            v = bucket[d].pop()
+            if not removed[v] and deg[v] == d:
+                break
+
+        removed[v] = True
+        order.append(v)
+        k = max(k, d)
+        for w in adj[v]:
+            if not removed[w]:
+                deg[w] -= 1
+                bucket[deg[w]].append(w)
+
+    return order, k
+
+# 三角形の個数
+def Triangle_Count(G: Graph, method = None):
+    """ グラフ G の三角形の個数を求める.
+
+    各辺を次数の小さい方から大きい方へ向け (同じならば番号で比べる), 各辺 vw について, v と w の出近傍の共通部分の大きさを足し合わせる.
+    出次数は O(sqrt(M)) 以下になる.
+    method = "bitset" のときは出近傍を多倍長整数のビット列 (ビットの位置は向きの順序での位置) で持ち, 共通部分を AND と popcount で求める.
+    method = "set" のときは set で持つ. ビット列はメモリを N^2 / 8 バイト程度使うので, None のときは密なグラフ (N^2 <= 64M) だけビット列にする.
+
+    計算量: O(M sqrt(M)) (ビット列の場合は 1 回の AND が O(N / w))
+    """
+
+    N = G.order(); M = G.size()
+    deg = [G.degree(v) for v in range(N)]
+    order = sorted(range(N), key = deg.__getitem__)
+    position = [0] * N
+    for i, v in enumerate(order):
+        position[v] = i
+
+    if method is None:
+        method = "bitset" if N * N <= 64 * M else "set"
+
+    if method == "bitset":
+        forward = [0] * N
+        for v in range(N):
+            p = position[v]
+            x = 0
+            for w in G.partner_yield(v):
+                if position[w] > p:
+                    x |= 1 << position[w]
+            forward[p] = x
+
+        count = 0
+        for x in forward:
+            y = x
+            while y:
+                low = y & -y
+                count += (x & forward[low.bit_length() - 1]).bit_count()
+                y ^= low
+        return count
+    else:
+        forward = [None] * N
+        for v in range(N):
+            p = position[v]
+            forward[v] = {w for w in G.partner_yield(v) if position[w] > p}
+
+        count = 0
+        for F in forward:
+            for w in F:
+                count += len(F & forward[w])
+        return count
+
+# 極大クリーク
+def Maximal_Cliques(G: Graph):
+    """ グラフ G の極大クリークを全て yield する (各クリークは頂点のリスト).
+
+    退化順序の各頂点 v について, v より後ろの近傍を候補, 前の近傍を除外として, ピボット付きの Bron-Kerbosch 法を行う.
+    部分問題は v の近傍に閉じているので, 近傍の中での隣接関係を v の近傍に番号を付け直した多倍長整数のビット列で持つ.
+
+    計算量: O(k N 3^{k/3}) (k は退化度)
+    """
+
+    N = G.order()
+    adj = [set(G.partner_yield(v)) for v in range(N)]
+    for v in range(N):
+        adj[v].discard(v)
+
+    order, _ = Degeneracy_Order(G)
+    position = [0] * N
+    for i, v in enumerate(order):
+        position[v] = i
+
+    for v in order:
+        neighbor = list(adj[v])
+        if not neighbor:
+            yield [v]
+            continue
+
+        index = {w: i for i, w in enumerate(neighbor)}
+        mask = [0] * len(neighbor)
+        P = X = 0
+        for i, w in enumerate(neighbor):
+            x = 0
+            for u in adj[w] & adj[v]:
+                x |= 1 << index[u]
+            mask[i] = x
+
+            if position[w] > position[v]:
+                P |= 1 << i
+            else:
+                X |= 1 << i
+
+        if P == 0:
+            if X == 0:
+                yield [v]
+            continue
+
+        def candidate(P, X):
+            """ P | X の中で P との隣接が最も多い頂点をピボットにして, P から調べる頂点を求める. """
+
+            best = -1; pivot_mask = 0
+            Y = P | X
+            while Y:
+                low = Y & -Y
+                m = mask[low.bit_length() - 1]
+                c = (P & m).bit_count()
+                if c > best:
+                    best = c; pivot_mask = m
+                Y ^= low
+            return P & ~pivot_mask
+
+        R = [v]
+        stack = [[P, X, candidate(P, X)]]
+        while stack:
+            frame = stack[-1]
+            P, X, C = frame
+            if C == 0:
+                stack.pop()
+                R.pop()
+                continue
+
+            low = C & -C
+            i = low.bit_length() - 1
+            frame[0] = P ^ low; frame[1] = X | low; frame[2] = C ^ low
+
+            R.append(neighbor[i])
+            P1 = P & mask[i]; X1 = X & mask[i]
+            if P1 == 0:
+                if X1 == 0:
+                    yield R[:]
+                R.pop()
+            else:
+                stack.append([P1, X1, candidate(P1, X1)])
+
+# 最大クリーク
+def Maximum_Clique(G: Graph):
+    """ グラフ G の最大クリークを 1 つ求める (頂点のリスト). """
+
+    best = []
+    for C in Maximal_Cliques(G):
+        if len(C) > len(best):
+            best = C
+    return best
+
 #=================================================
 #特別なグラフ
 #=================================================
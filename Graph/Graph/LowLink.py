@@ -1,115 +1,177 @@
 from Graph import *
 
-def Lowlink(G: Graph):
-    """ G の ord, lowlink を求める.
-
-    G: Graph
+def Lowlink_CSR(N, offset, target, edge):
+    """ CSR 形式の無向グラフに対して, 1 回の反復 DFS で lowlink と, それから決まる分解を全て求める.
+
+    頂点 v の近傍は target[offset[v]: offset[v + 1]] であり, edge[k] は target[k] へ向かう辺の番号 (同じ辺の両向きで同じ番号) である.
+    DFS 木の親への辺は, 頂点ではなく辺の番号で除くので, 多重辺も正しく扱う.
+
+    返り値は以下をキーとする辞書である.
+        'ord', 'low': 行きがけ順の番号と lowlink
+        'parent': DFS 木の親 (根は -1)
+        'bridges': 橋の番号のリスト
+        'articulation': 関節点のリスト
+        'two_edge_group', 'two_edge_count': 二辺連結成分の番号と個数
+        'bridge_tree': 二辺連結成分を頂点とし, 橋を辺とする森の親の配列 (根は -1)
+        'blocks': 二重連結成分 (ブロック) の頂点のリストのリスト (孤立点も 1 つのブロック)
+        'block_cut_tree': 頂点 0, ..., N - 1 とブロック N, ..., N + B - 1 を頂点とし, 頂点とそれを含むブロックを結ぶ森の親の配列 (根は DFS の根の頂点で -1)
     """
 
-    N = G.order()
-    tower = []
-    children = [[] for _ in range(N)]
     ord = [-1] * N
-    low = [-1] * N
-    def dfs(start, t):
-        ord[start] = low[start] = t
-        t += 1
-        tower.append(start)
-        stack = [(start, v, j) for v, j in G.partner_with_label_yield(start)]
-        while stack:
-            u, v, j = stack.pop()
-            if ord[v] != -1:
-                low[u] = min(low[u], ord[v])
-                continue
-
-            ord[v] = low[v] = t
-            tower.append(v)
-            children[u].append(v)
-            t += 1
-            stack.extend([(v, w, k) for w, k in G.partner_with_label_yield(v) if k != j])
-        return t
+    low = [0] * N
+    parent = [-1] * N
+    parent_edge = [-1] * N
+    it = list(offset[:N])
+
+    two_stack = []; block_stack = []
+    two_edge_group = [-1] * N; two_edge_count = 0
+    bridges = []; bridge_child = []
+    is_articulation = [False] * N
+    blocks = []
+    block_cut_tree = [-1] * N
 
     t = 0
-    for x in range(G.order()):
-        if ord[x] == -1:
-            t = dfs(x, t)
+    for r in range(N):
+        if ord[r] != -1:
+            continue
 
-    for x in reversed(tower):
-        for y in children[x]:
-            low[x] = min(low[x], low[y])
+        ord[r] = low[r] = t; t += 1
+        two_stack.append(r); block_stack.append(r)
+        root_children = 0
 
-    return { 'ord': ord, 'low': low }
+        stack = [r]
+        while stack:
+            v = stack[-1]
+            k = it[v]
+            if k < offset[v + 1]:
+                it[v] = k + 1
+                e = edge[k]
+                if e == parent_edge[v]:
+                    continue
+
+                w = target[k]
+                if ord[w] == -1:
+                    parent[w] = v; parent_edge[w] = e
+                    ord[w] = low[w] = t; t += 1
+                    two_stack.append(w); block_stack.append(w)
+                    stack.append(w)
+                elif ord[w] < low[v]:
+                    low[v] = ord[w]
+                continue
 
-# 橋列挙
-def Bridge(G: Graph):
-    """ G にある橋の id を列挙する.
+            # v の探索が終わった.
+            stack.pop()
 
-    G: Graph
-    """
+            # v が二辺連結成分の中で最初に訪れた頂点ならば, 成分を取り出す.
+            if low[v] == ord[v]:
+                while True:
+                    x = two_stack.pop()
+                    two_edge_group[x] = two_edge_count
+                    if x == v:
+                        break
+                two_edge_count += 1
 
-    data = Lowlink(G)
-    ord = data['ord']; low = data['low']
-    return [t for u, v, t in G.edge_yielder_with_label() if (ord[u] < low[v]) or (ord[v] < low[u])]
+                if v != r:
+                    bridges.append(parent_edge[v])
+                    bridge_child.append(v)
 
-# 関節点の列挙
-def Articulation_Point(G: Graph):
-    from collections import deque
+            if v == r:
+                continue
 
-    N=G.vertex_count()
-    A=[]
-    ord=[-1]*N; low=[-1]*N
-    flag=[0]*N
+            u = parent[v]
+            if low[v] < low[u]:
+                low[u] = low[v]
+
+            # u が v 側を切り離すならば, v 側と u でブロックを成す.
+            if low[v] >= ord[u]:
+                b = N + len(blocks)
+                block = [u]
+                while True:
+                    x = block_stack.pop()
+                    block.append(x)
+                    block_cut_tree[x] = b
+                    if x == v:
+                        break
+                blocks.append(block)
+                block_cut_tree.append(u)
+
+                if u == r:
+                    root_children += 1
+                else:
+                    is_articulation[u] = True
+
+        block_stack.pop()
+        if root_children >= 2:
+            is_articulation[r] = True
+        elif root_children == 0:
+            blocks.append([r])
+            block_cut_tree.append(r)
+
+    bridge_tree = [-1] * two_edge_count
+    for v in bridge_child:
+        bridge_tree[two_edge_group[v]] = two_edge_group[parent[v]]
+
+    return {
+        'ord': ord, 'low': low, 'parent': parent,
+        'bridges': bridges,
+        'articulation': [v for v in range(N) if is_articulation[v]],
+        'two_edge_group': two_edge_group, 'two_edge_count': two_edge_count,
+        'bridge_tree': bridge_tree,
+        'blocks': blocks,
+        'block_cut_tree': block_cut_tree
+    }
+
+def Lowlink_Decomposition(G: Graph):
+    """ G に対して Lowlink_CSR を適用する. 'bridges' は橋の (u, v, label) のリストになる.
+
+    G: Graph (Frozen_Graph でも良い)
+    """
+
+    from array import array
 
-    parent=[-1]*N
-    children=[[] for _ in range(N)]
+    N = G.order()
+    E = list(G.edge_yielder_with_label())
 
-    #BFSパート
+    offset = [0] * (N + 1)
+    for u, v, _ in E:
+        offset[u + 1] += 1
+        if u != v:
+            offset[v + 1] += 1
     for v in range(N):
-        if flag[v]:
-            continue
+        offset[v + 1] += offset[v]
 
-        k=0
-        S=deque([v])
-        T=[]
-        X=[]
+    target = array('i', bytes(4 * offset[N])); edge = array('i', bytes(4 * offset[N]))
+    position = offset[:N]
+    for j, (u, v, _) in enumerate(E):
+        target[position[u]] = v; edge[position[u]] = j; position[u] += 1
+        if u != v:
+            target[position[v]] = u; edge[position[v]] = j; position[v] += 1
 
-        while S:
-            u=S.pop()
-            if flag[u]:
-                continue
+    data = Lowlink_CSR(N, offset, target, edge)
+    data['bridges'] = [E[j] for j in data['bridges']]
+    return data
 
-            T.append(u)
-            ord[u]=k
-            k+=1
-            flag[u]=1
+def Lowlink(G: Graph):
+    """ G の ord, lowlink を求める.
 
-            for w in G.partner_yield(u):
-                if not flag[w]:
-                    S.append(w)
-                    parent[w]=u
+    G: Graph
+    """
 
-        for w in T:
-            low[w]=ord[w]
+    data = Lowlink_Decomposition(G)
+    return { 'ord': data['ord'], 'low': data['low'] }
 
-        for w in T[:0:-1]:
-            children[parent[w]].append(w)
+# 橋列挙
+def Bridge(G: Graph):
+    """ G にある橋の id を列挙する.
 
-        for w in T[:0:-1]:
-            for x in G.partner_yield(w):
-                if w==v or x!=parent[w]:
-                    low[w]=min(low[w],low[x],ord[x])
+    G: Graph
+    """
 
-        #根での判定
-        if len(children[v])>=2:
-            A.append(v)
+    return [label for _, _, label in Lowlink_Decomposition(G)['bridges']]
 
-        #根以外の判定
-        for w in T[:0:-1]:
-            for u in children[w]:
-                if ord[w]<=low[u]:
-                    A.append(w)
-                    break
-    return A
+# 関節点の列挙
+def Articulation_Point(G: Graph):
+    return Lowlink_Decomposition(G)['articulation']
 
 #二辺連結成分分解
 def Two_Edge_Connected_Components(G: Graph):
@@ -119,26 +181,40 @@ def Two_Edge_Connected_Components(G: Graph):
     G: Graph
     """
 
-    bridges = set(Bridge(G))
+    data = Lowlink_Decomposition(G)
+    group = data['two_edge_group']
+    comps = [[] for _ in range(data['two_edge_count'])]
+    for v in range(G.order()):
+        comps[group[v]].append(v)
 
-    comps = []
-    t = 0
-    comp_id = [-1] * G.order()
-    for x in range(G.order()):
-        if comp_id[x] != -1:
-            continue
+    return { 'group': group, 'comps': comps }
 
-        comp_id[x] = t
-        c = [x]
-        stack = [x]
-        while stack:
-            u = stack.pop()
-            for v, j in G.partner_with_label_yield(u):
-                if (j not in bridges) and (comp_id[v] == -1):
-                    comp_id[v] = t
-                    c.append(v)
-                    stack.append(v)
-        comps.append(c)
-        t += 1
-
-    return { 'group': comp_id, 'comps': comps }
+#二重連結成分分解
+def Biconnected_Components(G: Graph):
+    """ グラフ G を二重連結成分 (ブロック) に分解する. 孤立点も 1 つのブロックとする.
+
+    G: Graph
+    """
+
+    return Lowlink_Decomposition(G)['blocks']
+
+# 橋木
+def Bridge_Tree(G: Graph):
+    """ 二辺連結成分を縮約した森を求める.
+
+    返り値は { 'group': 各頂点の二辺連結成分の番号, 'parent': 成分の森の親の配列 (根は -1) } である.
+    """
+
+    data = Lowlink_Decomposition(G)
+    return { 'group': data['two_edge_group'], 'parent': data['bridge_tree'] }
+
+# Block-Cut 木
+def Block_Cut_Tree(G: Graph):
+    """ Block-Cut 木 (頂点 0, ..., N - 1 とブロック N, ..., N + B - 1 からなる森) を求める.
+
+    返り値は { 'blocks': ブロックのリスト, 'parent': 森の親の配列 (根は -1) } である.
+    関節点でない頂点は, それを含む唯一のブロックの子 (又は根) になる.
+    """
+
+    data = Lowlink_Decomposition(G)
+    return { 'blocks': data['blocks'], 'parent': data['block_cut_tree'] }
@@ -1,21 +1,29 @@
 from Weighted_Digraph import *
 
 def Bellman_Fold(D: Weigthed_Digraph, start, goal, default = None):
-    N = D.order()
+    """ Bellman-Ford 法を用いて, start から goal への距離を求める (負閉路の影響を受ける場合は -inf).
+
+    D: 重み付き有向グラフ (Weigthed_Digraph, Frozen_Weigthed_Digraph)
+    """
 
-    arcs = []
-    for u in range(N):
-        arcs.extend([(u, v, w) for v, w, _ in D.adjacent_out[u]])
+    N = D.order()
+    adjacent_out = D.adjacent_out
 
     inf = float('inf')
     dist = [inf] * N; dist[start] = 0
 
+    # 弧のリストを作らずに, 始点ごとに隣接リストを走査する (始点までの距離が inf の弧は飛ばす).
     for _ in range(N - 1):
         updated = False
-        for u, v, w in arcs:
-            if dist[u] + w < dist[v]:
-                dist[v] = dist[u] + w
-                updated = True
+        for u in range(N):
+            du = dist[u]
+            if du == inf:
+                continue
+
+            for v, w, _ in adjacent_out[u]:
+                if du + w < dist[v]:
+                    dist[v] = du + w
+                    updated = True
 
         if not updated:
             break
@@ -23,12 +31,138 @@ def Bellman_Fold(D: Weigthed_Digraph, start, goal, default = None):
     # 負閉路検出
     for _ in range(N):
         updated = False
-        for u, v, w in arcs:
-            if dist[u] + w < dist[v]:
-                dist[v] = -inf
-                updated = True
+        for u in range(N):
+            du = dist[u]
+            if du == inf:
+                continue
+
+            for v, w, _ in adjacent_out[u]:
+                if du + w < dist[v]:
+                    dist[v] = -inf
+                    updated = True
 
         if not updated:
             break
 
     return dist[goal]
+
+def SPFA_All(D: Weigthed_Digraph, start):
+    """ キューを用いた Bellman-Ford 法 (SPFA) で, start から各頂点への距離を求める (負閉路の影響を受ける場合は -inf, 到達不可能な場合は inf).
+
+    D: 重み付き有向グラフ (Weigthed_Digraph, Frozen_Weigthed_Digraph)
+
+    キューは SLF (先頭より小さい距離の頂点は先頭に入れる) と LLL (平均より大きい距離の頂点は末尾に回す) で並べ替える.
+    負閉路は Tarjan の部分木解体法で検出する: 最短路木を DFS 順の双方向リストで持ち, v の距離が更新されたら v の部分木を木から外す.
+    このとき, 更新元の頂点が v の部分木に含まれるならば, v は負閉路上にある.
+    """
+
+    from collections import deque
+
+    N = D.order()
+    adjacent_out = D.adjacent_out
+
+    inf = float('inf')
+    dist = [inf] * N; dist[start] = 0
+
+    # 最短路木 (DFS 順の循環する双方向リスト)
+    next = [-1] * N; prev = [-1] * N; depth = [0] * N
+    in_tree = [False] * N
+    next[start] = prev[start] = start; in_tree[start] = True
+
+    in_queue = [False] * N; in_queue[start] = True
+    Q = deque([start])
+    total = 0; count = 1
+
+    def kill(s):
+        """ s から到達可能な頂点の距離を -inf にする. """
+
+        nonlocal total, count
+
+        stack = [s]
+        while stack:
+            v = stack.pop()
+            if dist[v] == -inf:
+                continue
+
+            if in_queue[v]:
+                in_queue[v] = False
+                total -= dist[v]; count -= 1
+
+            if in_tree[v]:
+                in_tree[v] = False
+                next[prev[v]] = next[v]; prev[next[v]] = prev[v]
+
+            dist[v] = -inf
+            for y, _, _ in adjacent_out[v]:
+                if dist[y] != -inf:
+                    stack.append(y)
+
+    while Q:
+        # LLL: 先頭の距離が平均より大きい間, 先頭を末尾に回す.
+        for _ in range(count):
+            x = Q[0]
+            if in_queue[x] and dist[x] * count > total:
+                Q.rotate(-1)
+            else:
+                break
+
+        x = Q.popleft()
+        if not in_queue[x]:
+            continue
+
+        in_queue[x] = False
+        total -= dist[x]; count -= 1
+
+        if not in_tree[x]:
+            continue
+
+        d = dist[x]
+        for y, w, _ in adjacent_out[x]:
+            if not (d + w < dist[y]):
+                continue
+
+            cycle = (y == x)
+            if in_tree[y]:
+                # y の部分木を解体する.
+                z = next[y]
+                while z != y and depth[z] > depth[y]:
+                    if z == x:
+                        cycle = True
+                    in_tree[z] = False
+                    z = next[z]
+
+                next[prev[y]] = z; prev[z] = prev[y]
+                in_tree[y] = False
+
+            if cycle:
+                kill(y)
+                break
+
+            if in_queue[y]:
+                total += d + w - dist[y]
+            dist[y] = d + w
+
+            depth[y] = depth[x] + 1
+            next[y] = next[x]; prev[next[x]] = y
+            next[x] = y; prev[y] = x
+            in_tree[y] = True
+
+            if not in_queue[y]:
+                in_queue[y] = True
+                total += dist[y]; count += 1
+
+                # SLF: 先頭よりも距離が小さいならば, 先頭に入れる.
+                if Q and dist[y] < dist[Q[0]]:
+                    Q.appendleft(y)
+                else:
+                    Q.append(y)
+
+    return dist
+
+def SPFA(D: Weigthed_Digraph, start, goal, default = None):
+    """ SPFA を用いて, start から goal への距離を求める (負閉路の影響を受ける場合は -inf, 返り値の形式は Bellman_Fold と同じ).
+
+    D: 重み付き有向グラフ (Weigthed_Digraph, Frozen_Weigthed_Digraph)
+    """
+
+    return SPFA_All(D, start)[goal]
@@ -8,6 +8,7 @@ def Dijkstra(D: Weigthed_Digraph, start, goal, default = None):
     fix = [False] * D.order()
     parent = [None] * D.order()
     upper = [None] * D.order()
+    adjacent_out = D.adjacent_out
 
     Q = [(0, start)]
     while Q:
@@ -19,7 +20,7 @@ def Dijkstra(D: Weigthed_Digraph, start, goal, default = None):
         if x == goal:
             break
 
-        for y, w, id in D.adjacent_out[x]:
+        for y, w, id in adjacent_out[x]:
             if d + w < dist[y]:
                 dist[y] = d + w
                 parent[y] = x
@@ -38,3 +39,538 @@ def Dijkstra(D: Weigthed_Digraph, start, goal, default = None):
         vertex.append(x)
 
     return {'dist': dist[goal], 'arc': arc[::-1], 'vertex': vertex[::-1]}
+
+def Bidirectional_Dijkstra(D: Weigthed_Digraph, start, goal, default = None):
+    """ 双方向 Dijkstra 法を用いて, start から goal への最短路を求める (返り値の形式は Dijkstra と同じ).
+
+    start からは出近傍 (adjacent_out) を, goal からは入近傍 (adjacent_in) を交互に探索し, 2 つの探索の距離の和が暫定の最短距離以上になったら終了する.
+
+    D: 辺の重みが全て非負の有向グラフ
+    """
+
+    from heapq import heappush, heappop
+
+    inf = float('inf')
+    N = D.order()
+
+    if start == goal:
+        return {'dist': 0, 'arc': [], 'vertex': [start]}
+
+    # 添字 0 が start からの探索, 添字 1 が goal からの探索
+    adjacent = (D.adjacent_out, D.adjacent_in)
+    dist = ([inf] * N, [inf] * N)
+    fix = ([False] * N, [False] * N)
+    parent = ([None] * N, [None] * N)
+    upper = ([None] * N, [None] * N)
+    Q = ([(0, start)], [(0, goal)])
+
+    dist[0][start] = 0; dist[1][goal] = 0
+
+    best = inf; meet = -1
+    while Q[0] and Q[1]:
+        if Q[0][0][0] + Q[1][0][0] >= best:
+            break
+
+        side = 0 if Q[0][0][0] <= Q[1][0][0] else 1
+        dist_s = dist[side]; dist_t = dist[1 - side]
+        fix_s = fix[side]; parent_s = parent[side]; upper_s = upper[side]; Q_s = Q[side]
+
+        d, x = heappop(Q_s)
+        if fix_s[x]:
+            continue
+        fix_s[x] = True
+
+        for y, w, id in adjacent[side][x]:
+            e = d + w
+            if e < dist_s[y]:
+                dist_s[y] = e
+                parent_s[y] = x
+                upper_s[y] = id
+                heappush(Q_s, (e, y))
+
+            if e + dist_t[y] < best:
+                best = e + dist_t[y]
+                meet = y
+
+    if best == inf:
+        return {'dist': default, 'arc': None, 'vertex': None}
+
+    vertex = [meet]; arc = []
+    x = meet
+    while x != start:
+        arc.append(upper[0][x])
+        x = parent[0][x]
+        vertex.append(x)
+
+    vertex.reverse(); arc.reverse()
+
+    x = meet
+    while x != goal:
+        arc.append(upper[1][x])
+        x = parent[1][x]
+        vertex.append(x)
+
+    return {'dist': best, 'arc': arc, 'vertex': vertex}
+
+class ALT_Landmark:
+    """ A* 探索 (ALT: A*, Landmarks, Triangle inequality) 用のランドマークとの距離を前計算する. """
+
+    __slots__ = ("N", "landmarks", "dist_from", "dist_to")
+
+    def __init__(self, D: Weigthed_Digraph, k = 4, landmarks = None):
+        """ ランドマークとの距離を前計算する.
+
+        D: 辺の重みが全て非負の有向グラフ (入近傍が必要)
+        k: ランドマークの個数 (landmarks を指定しない場合, 既に選んだランドマークから最も遠い頂点を順に選ぶ)
+        landmarks: ランドマークのリスト
+
+        dist_from[i * N + v]: i 番目のランドマークから v への距離
+        dist_to[i * N + v]: v から i 番目のランドマークへの距離
+        (array('d') で保持し, 到達不可能な場合は inf)
+        """
+
+        from heapq import heappush, heappop
+        from array import array
+
+        inf = float('inf')
+        N = self.N = D.order()
+
+        def distance_all(adjacent, s):
+            dist = [inf] * N; dist[s] = 0
+            Q = [(0, s)]
+            while Q:
+                d, x = heappop(Q)
+                if d > dist[x]:
+                    continue
+
+                for y, w, _ in adjacent[x]:
+                    if d + w < dist[y]:
+                        dist[y] = d + w
+                        heappush(Q, (d + w, y))
+            return dist
+
+        adjacent_out = D.adjacent_out; adjacent_in = D.adjacent_in
+
+        if landmarks is None:
+            landmarks = []
+            k = min(k, N)
+
+            # 最初のランドマークは頂点 0 から最も遠い頂点とし, 以降は既に選んだランドマークからの距離の和が最大の頂点を選ぶ.
+            score = [0] * N
+            dist = distance_all(adjacent_out, 0) if N else []
+            chosen = [False] * N
+            for _ in range(k):
+                candidate = [v for v in range(N) if not chosen[v]]
+                if not landmarks:
+                    v = max(candidate, key = lambda v: dist[v] if dist[v] < inf else -1)
+                else:
+                    v = max(candidate, key = lambda v: score[v])
+                landmarks.append(v)
+                chosen[v] = True
+
+                dist = distance_all(adjacent_out, v)
+                for x in range(N):
+                    if dist[x] < inf:
+                        score[x] += dist[x]
+
+        self.landmarks = list(landmarks)
+        self.dist_from = array('d')
+        self.dist_to = array('d')
+        for l in self.landmarks:
+            self.dist_from.extend(distance_all(adjacent_out, l))
+            self.dist_to.extend(distance_all(adjacent_in, l))
+
+    def lower_bound(self, v, t):
+        """ v から t への距離の下界を三角不等式から求める (v から t へ到達不可能と分かる場合は inf). """
+
+        inf = float('inf')
+        N = self.N
+        dist_from = self.dist_from; dist_to = self.dist_to
+
+        bound = 0
+        for i in range(len(self.landmarks)):
+            # d(v, l) - d(t, l) <= d(v, t)
+            a = dist_to[i * N + v]; b = dist_to[i * N + t]
+            if b < inf:
+                if a == inf:
+                    return inf
+                bound = max(bound, a - b)
+
+            # d(l, t) - d(l, v) <= d(v, t)
+            a = dist_from[i * N + t]; b = dist_from[i * N + v]
+            if b < inf:
+                if a == inf:
+                    return inf
+                bound = max(bound, a - b)
+        return bound
+
+def ALT_Dijkstra(D: Weigthed_Digraph, start, goal, landmark: ALT_Landmark, default = None):
+    """ ランドマークによる下界をポテンシャルとする A* 探索で, start から goal への最短路を求める (返り値の形式は Dijkstra と同じ).
+
+    D: 辺の重みが全て非負の有向グラフ
+    landmark: D に対して前計算した ALT_Landmark
+    """
+
+    from heapq import heappush, heappop
+
+    inf = float('inf')
+    N = D.order()
+    dist = [inf] * N; dist[start] = 0
+    fix = [False] * N
+    parent = [None] * N
+    upper = [None] * N
+    adjacent_out = D.adjacent_out
+
+    # ポテンシャル (goal までの距離の下界) はメモ化する.
+    potential = {}
+    def h(v):
+        if v not in potential:
+            potential[v] = landmark.lower_bound(v, goal)
+        return potential[v]
+
+    if h(start) == inf:
+        return {'dist': default, 'arc': None, 'vertex': None}
+
+    Q = [(h(start), start)]
+    while Q:
+        _, x = heappop(Q)
+        if fix[x]:
+            continue
+
+        fix[x] = True
+        if x == goal:
+            break
+
+        d = dist[x]
+        for y, w, id in adjacent_out[x]:
+            if d + w < dist[y] and not fix[y]:
+                hy = h(y)
+                if hy == inf:
+                    continue
+
+                dist[y] = d + w
+                parent[y] = x
+                upper[y] = id
+                heappush(Q, (dist[y] + hy, y))
+
+    if dist[goal] == inf:
+        return {'dist': default, 'arc': None, 'vertex': None}
+
+    vertex = [goal]
+    arc = []
+    x = goal
+    while x != start:
+        arc.append(upper[x])
+        x = parent[x]
+        vertex.append(x)
+
+    return {'dist': dist[goal], 'arc': arc[::-1], 'vertex': vertex[::-1]}
+
+class Shortest_Path_Engine:
+    """ 同じグラフに対する最短路クエリを, 作業用の配列を使い回して処理する.
+
+    各配列にはバージョン (何回目の探索で書き込まれたか) を持たせ, 探索の初期化を O(1) で行う.
+    また, 直前と同じ始点集合からのクエリは, 前回の探索を途中から再開して答える.
+    """
+
+    __slots__ = ("N", "__adjacent_out", "__dist", "__parent", "__upper", "__stamp", "__fix", "__version", "__sources", "__Q")
+
+    def __init__(self, D: Weigthed_Digraph):
+        """ D: 辺の重みが全て非負の有向グラフ (探索中に D を変更してはならない) """
+
+        self.N = N = D.order()
+        self.__adjacent_out = D.adjacent_out
+        self.__dist = [0] * N
+        self.__parent = [-1] * N
+        self.__upper = [None] * N
+
+        # stamp[v] == version ならば, dist[v] は今回の探索で書き込まれた値である.
+        # fix[v] == version ならば, v の距離は確定している.
+        self.__stamp = [0] * N
+        self.__fix = [0] * N
+        self.__version = 0
+        self.__sources = None
+        self.__Q = []
+
+    def __prepare(self, start):
+        """ 始点 (集合) を start とする探索を用意する. 直前の探索と始点集合が同じならば, その探索を引き継ぐ. """
+
+        sources = (start, ) if isinstance(start, int) else tuple(sorted(set(start)))
+        if sources == self.__sources:
+            return
+
+        self.__version += 1
+        self.__sources = sources
+        version = self.__version
+        dist = self.__dist; parent = self.__parent; upper = self.__upper; stamp = self.__stamp
+
+        Q = self.__Q = []
+        for s in sources:
+            dist[s] = 0; parent[s] = -1; upper[s] = None
+            stamp[s] = version
+            Q.append((0, s))
+
+    def __run(self, goal = -1):
+        """ goal の距離が確定するまで (goal = -1 ならば全ての頂点の距離が確定するまで) 探索を進める. """
+
+        from heapq import heappush, heappop
+
+        version = self.__version
+        dist = self.__dist; parent = self.__parent; upper = self.__upper
+        stamp = self.__stamp; fix = self.__fix
+        adjacent_out = self.__adjacent_out
+        Q = self.__Q
+
+        if goal != -1 and fix[goal] == version:
+            return
+
+        while Q:
+            d, x = heappop(Q)
+            if fix[x] == version:
+                continue
+
+            fix[x] = version
+            for y, w, id in adjacent_out[x]:
+                e = d + w
+                if stamp[y] != version or e < dist[y]:
+                    stamp[y] = version
+                    dist[y] = e
+                    parent[y] = x
+                    upper[y] = id
+                    heappush(Q, (e, y))
+
+            if x == goal:
+                return
+
+    def distance(self, start, goal, default = None):
+        """ start から goal への距離を求める.
+
+        start: 始点, または始点の集合 (多始点の場合, いずれかの始点からの距離の最小値)
+        default: 到達不可能な場合の返り値
+        """
+
+        self.__prepare(start)
+        self.__run(goal)
+
+        if self.__fix[goal] != self.__version:
+            return default
+        return self.__dist[goal]
+
+    def shortest_path(self, start, goal, default = None):
+        """ start から goal への最短路を求める (返り値の形式は Dijkstra と同じ). 多始点の場合, 'vertex' の先頭が実際に使われた始点である. """
+
+        self.__prepare(start)
+        self.__run(goal)
+
+        if self.__fix[goal] != self.__version:
+            return {'dist': default, 'arc': None, 'vertex': None}
+
+        parent = self.__parent; upper = self.__upper
+        vertex = [goal]
+        arc = []
+        x = goal
+        while parent[x] != -1:
+            arc.append(upper[x])
+            x = parent[x]
+            vertex.append(x)
+
+        return {'dist': self.__dist[goal], 'arc': arc[::-1], 'vertex': vertex[::-1]}
+
+    def distance_all(self, start, default = float('inf')):
+        """ start から各頂点への距離を求める.
+
+        start: 始点, または始点の集合
+        default: 到達不可能な場合の値
+        """
+
+        self.__prepare(start)
+        self.__run()
+
+        version = self.__version
+        dist = self.__dist; fix = self.__fix
+        return [dist[v] if fix[v] == version else default for v in range(self.N)]
+
+    def query_many(self, pairs, default = None):
+        """ (start, goal) の組のリスト pairs の各クエリに答える.
+
+        始点ごとにまとめて処理し, 同じ始点のクエリでは探索を共有する.
+        返り値の i 番目は pairs[i] の答えである.
+        """
+
+        pairs = list(pairs)
+        order = sorted(range(len(pairs)), key = lambda i: pairs[i][0])
+
+        ans = [default] * len(pairs)
+        for i in order:
+            start, goal = pairs[i]
+            ans[i] = self.distance(start, goal, default)
+        return ans
+
+def Integer_Weight_Range(D: Weigthed_Digraph):
+    """ D の弧の重みが全て非負整数ならば (重みの最小値, 重みの最大値) を, そうでなければ None を返す (弧が存在しない場合は (0, 0)). """
+
+    low = high = None
+    for x in range(D.order()):
+        for _, w, _ in D.adjacent_out[x]:
+            if not (isinstance(w, int) and w >= 0):
+                return None
+
+            if low is None:
+                low = high = w
+            elif w < low:
+                low = w
+            elif high < w:
+                high = w
+
+    return (0, 0) if low is None else (low, high)
+
+def Integer_Dijkstra(D: Weigthed_Digraph, start, goal, default = None, method = None, weight_range = None):
+    """ 弧の重みが全て非負整数である有向グラフに対して, start から goal への最短路を求める (返り値の形式は Dijkstra と同じ).
+
+    method: 優先度付きキューの種類
+        "01": 0-1 BFS (重みが 0, 1 のみ)
+        "dial": 重み W 以下に対する W + 1 個のバケットを循環させるキュー (Dial 法)
+        "radix": 頂点のみをバケットに持つ Radix Heap
+        None: weight_range から自動で選ぶ.
+    weight_range: (重みの最小値, 重みの最大値) (None ならば Integer_Weight_Range で求める. 同じグラフに対して繰り返し呼ぶ場合は事前に求めて渡すとよい.)
+    """
+
+    if weight_range is None:
+        weight_range = Integer_Weight_Range(D)
+        assert weight_range is not None, "弧の重みは非負整数でなければなりません."
+
+    N = D.order()
+    _, W = weight_range
+
+    if method is None:
+        if W <= 1:
+            method = "01"
+        elif 2 * W <= N:
+            # Dial 法は最大距離に比例する回数だけバケットを走査するので, W が大きい場合は Radix Heap を用いる.
+            method = "dial"
+        else:
+            method = "radix"
+
+    dist = [-1] * N
+    fix = [False] * N
+    parent = [None] * N
+    upper = [None] * N
+    adjacent_out = D.adjacent_out
+
+    # dist[v] = -1 は未到達を表す.
+    dist[start] = 0
+
+    if method == "01":
+        # 最初に取り出した時点で距離が確定するのは, 重みが 0, 1 のみの場合に限る.
+        assert W <= 1, "0-1 BFS は弧の重みが 0 か 1 のときのみ使えます."
+
+        from collections import deque
+
+        Q = deque([start])
+        while Q:
+            x = Q.popleft()
+            if fix[x]:
+                continue
+
+            fix[x] = True
+            if x == goal:
+                break
+
+            d = dist[x]
+            for y, w, id in adjacent_out[x]:
+                if dist[y] == -1 or d + w < dist[y]:
+                    dist[y] = d + w
+                    parent[y] = x
+                    upper[y] = id
+                    if w == 0:
+                        Q.appendleft(y)
+                    else:
+                        Q.append(y)
+    elif method == "dial":
+        # 未確定の頂点の距離は [d, d + W] に収まるので, 距離 mod (W + 1) のバケットに入れる.
+        K = W + 1
+        buckets = [[] for _ in range(K)]
+        buckets[0].append(start)
+        pending = 1
+        d = 0
+        while pending:
+            bucket = buckets[d % K]
+            while bucket:
+                x = bucket.pop()
+                pending -= 1
+                if fix[x] or dist[x] != d:
+                    continue
+
+                fix[x] = True
+                if x == goal:
+                    pending = 0
+                    break
+
+                for y, w, id in adjacent_out[x]:
+                    if dist[y] == -1 or d + w < dist[y]:
+                        dist[y] = d + w
+                        parent[y] = x
+                        upper[y] = id
+                        buckets[(d + w) % K].append(y)
+                        pending += 1
+            d += 1
+    elif method == "radix":
+        # バケットには頂点のみを入れ, キーは dist から参照する (古い要素は fix で読み飛ばす).
+        buckets = [[] for _ in range((W * N).bit_length() + 1)]
+        buckets[0].append(start)
+        pending = 1
+        last = 0
+        while pending:
+            if not buckets[0]:
+                i = 1
+                while not buckets[i]:
+                    i += 1
+
+                bucket = buckets[i]; buckets[i] = []
+                last = -1
+                for v in bucket:
+                    if not fix[v] and (last == -1 or dist[v] < last):
+                        last = dist[v]
+
+                if last == -1:
+                    pending -= len(bucket)
+                    continue
+
+                for v in bucket:
+                    if fix[v]:
+                        pending -= 1
+                    else:
+                        buckets[(dist[v] ^ last).bit_length()].append(v)
+
+            x = buckets[0].pop()
+            pending -= 1
+            if fix[x]:
+                continue
+
+            fix[x] = True
+            if x == goal:
+                break
+
+            d = dist[x]
+            for y, w, id in adjacent_out[x]:
+                if dist[y] == -1 or d + w < dist[y]:
+                    dist[y] = d + w
+                    parent[y] = x
+                    upper[y] = id
+                    buckets[((d + w) ^ last).bit_length()].append(y)
+                    pending += 1
+    else:
+        raise ValueError(f"method {method} は存在しません.")
+
+    if not fix[goal]:
+        return {'dist': default, 'arc': None, 'vertex': None}
+
+    vertex = [goal]
+    arc = []
+    x = goal
+    while x != start:
+        arc.append(upper[x])
+        x = parent[x]
+        vertex.append(x)
+
+    return {'dist': dist[goal], 'arc': arc[::-1], 'vertex': vertex[::-1]}
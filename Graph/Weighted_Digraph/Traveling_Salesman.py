@@ -29,3 +29,99 @@ def Traveling_Salesman(D: Weigthed_Digraph, default = -1):
                 else:
                     dp_T[x] = min(dp_T[x], dp_S[y] + w)
     return dp[-1][0]
+
+def Traveling_Salesman_NumPy(D: Weigthed_Digraph, default = -1, with_path = False):
+    """ NumPy を用いた Held-Karp 法で巡回セールスマン問題を解く.
+
+    頂点 0 を始点とし, 訪問済み集合 S (頂点 0 以外) を要素数ごとに処理する. 各層では終点 x ごとに, 1 つ前の層の行と重み行列の列の和の最小値をまとめて求める.
+    with_path = False ならば, 直前の層のみを保持する.
+
+    Args:
+        D (Weigthed_Digraph)
+        default: 巡回路が存在しない場合の返り値
+        with_path (bool, optional): True ならば, (最小コスト, 巡回路の頂点列 [0, ..., 0]) を返す (巡回路が存在しない場合は (default, None)).
+    """
+
+    import numpy as np
+
+    N = D.order()
+    inf = float('inf')
+
+    W = np.full((N, N), inf)
+    is_integer = True
+    for y in range(N):
+        for x, w, _ in D.adjacent_out[y]:
+            if w < W[y, x]:
+                W[y, x] = w
+            if not isinstance(w, int):
+                is_integer = False
+
+    def answer(cost, path):
+        if cost == inf:
+            return (default, None) if with_path else default
+
+        if is_integer:
+            cost = int(cost)
+        return (cost, path) if with_path else cost
+
+    if N == 1:
+        return answer(W[0, 0], [0, 0])
+
+    # 頂点 1, 2, ..., N - 1 を 0, 1, ..., M - 1 とする.
+    M = N - 1
+    A = W[1:, 1:]
+    start = W[0, 1:]
+    goal = W[1:, 0]
+
+    popcount = np.zeros(1 << M, dtype = np.int8)
+    for i in range(M):
+        popcount[1 << i: 1 << (i + 1)] = popcount[: 1 << i] + 1
+
+    order = np.argsort(popcount, kind = 'stable')
+    bounds = np.searchsorted(popcount[order], np.arange(M + 2))
+
+    # position[S]: S が属する層の中での S の番号
+    position = np.empty(1 << M, dtype = np.int64)
+    for k in range(M + 1):
+        position[order[bounds[k]: bounds[k + 1]]] = np.arange(bounds[k + 1] - bounds[k])
+
+    # dp[k][position[S], x]: 頂点 0 から S の頂点を全て通って x (x ∈ S) に到達する最小コスト
+    previous = start.reshape(1, M)[:, :0]
+    layers = []
+    for k in range(1, M + 1):
+        masks = order[bounds[k]: bounds[k + 1]]
+        current = np.full((len(masks), M), inf)
+        for x in range(M):
+            index = np.flatnonzero((masks >> x) & 1)
+            if k == 1:
+                current[index, x] = start[x]
+                continue
+
+            before = position[masks[index] ^ (1 << x)]
+            current[index, x] = (previous[before] + A[:, x]).min(axis = 1)
+
+        if with_path:
+            layers.append(current)
+        previous = current
+
+    last = previous[0] + goal
+    cost = last.min()
+    if not (cost < inf):
+        return answer(inf, None)
+
+    if not with_path:
+        return answer(cost, None)
+
+    path = [0]
+    x = int(last.argmin())
+    S = (1 << M) - 1
+    for k in range(M, 1, -1):
+        path.append(x + 1)
+        T = S ^ (1 << x)
+        candidate = layers[k - 2][position[T]] + A[:, x]
+        x, S = int(candidate.argmin()), T
+    path.append(x + 1)
+    path.append(0)
+    path.reverse()
+
+    return answer(cost, path)
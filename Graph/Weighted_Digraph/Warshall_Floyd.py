@@ -3,7 +3,7 @@ from Weighted_Digraph import *
 def Warshall_Floyd(D: Weigthed_Digraph):
     """ Warshall-Floyd 法を用いて, 全点間距離を求める.
 
-    D: 重み付き有向グラフ
+    D: 重み付き有向グラフ (Weigthed_Digraph, Frozen_Weigthed_Digraph)
     """
 
     N = D.order()
@@ -19,16 +19,79 @@ def Warshall_Floyd(D: Weigthed_Digraph):
                 for q in range(N):
                     dist_p[q] = min(dist_p[q], dist_p[r] + dist_r[q])
 
+    adjacent_out = D.adjacent_out
     for u in range(N):
         dist_u = dist[u]
-        for v, w, _ in D.adjacent_out[u]:
+        for v, w, _ in adjacent_out[u]:
             dist_u[v] = min(dist_u[v], w)
 
     three_loop()
 
-    if any(dist[u][u] < 0 for u in range(N)):
-        for u in [u for u in range(N) if dist[u][u] < 0]:
-            dist[u][u] = -inf
-        three_loop()
+    # 負閉路上の頂点 w を経由できる u -> v の距離は -inf になる.
+    for w in [w for w in range(N) if dist[w][w] < 0]:
+        from_w = [v for v in range(N) if dist[w][v] < inf]
+        for u in range(N):
+            if dist[u][w] < inf:
+                dist_u = dist[u]
+                for v in from_w:
+                    dist_u[v] = -inf
 
-    return dist
\ No newline at end of file
+    return dist
+def Warshall_Floyd_NumPy(D: Weigthed_Digraph, block = None, as_array = False):
+    """ NumPy を用いて, Warshall-Floyd 法で全点間距離を求める (負閉路の影響を受ける場合は -inf).
+
+    D: 重み付き有向グラフ (Weigthed_Digraph, Frozen_Weigthed_Digraph)
+    block: None ならば, 中継点 r ごとに行列全体を 1 回で更新する.
+           正の整数ならば, 中継点を block 個ずつに分け, 行も block 行ずつの帯に分けて更新する (N が大きい場合にキャッシュに収まりやすくなる).
+    as_array: True ならば numpy.ndarray (float64) を, False ならば Warshall_Floyd と同じ形式のリストを返す.
+
+    ※ 距離は float64 で計算するため, 整数の重みでは絶対値が 2^53 以下の距離のみ正確である.
+    """
+
+    import numpy as np
+
+    N = D.order()
+    inf = float('inf')
+
+    dist = np.full((N, N), inf)
+    np.fill_diagonal(dist, 0)
+
+    sources = []; targets = []; weights = []
+    is_integer = True
+    adjacent_out = D.adjacent_out
+    for u in range(N):
+        for v, w, _ in adjacent_out[u]:
+            sources.append(u); targets.append(v); weights.append(w)
+            if not isinstance(w, int):
+                is_integer = False
+    np.minimum.at(dist, (np.array(sources, dtype = np.int64), np.array(targets, dtype = np.int64)), np.array(weights, dtype = np.float64))
+
+    # 負閉路がある場合, 距離が -inf に発散して (-inf) + inf = nan が生じうる. nan は "経路なし" として fmin で無視する.
+    if block is None or block >= N:
+        for r in range(N):
+            np.fmin(dist, dist[:, r, None] + dist[r, None, :], out = dist)
+    else:
+        for k in range(0, N, block):
+            K = range(k, min(k + block, N))
+
+            # 中継点の帯 [k, k + block) を先に処理して, 中継点の行を確定させる.
+            strips = [k] + [i for i in range(0, N, block) if i != k]
+            for i in strips:
+                strip = dist[i: i + block]
+                for r in K:
+                    np.fmin(strip, strip[:, r, None] + dist[r, None, :], out = strip)
+
+    # 負閉路上の頂点 w を経由できる u -> v の距離は -inf になる.
+    negative = np.diagonal(dist) < 0
+    if negative.any():
+        reach = (dist < inf).astype(np.float64)
+        through = (reach[:, negative] @ reach[negative, :]) > 0
+        dist[through] = -inf
+
+    if as_array:
+        return dist
+
+    if is_integer:
+        return [[int(x) if -inf < x < inf else x for x in row] for row in dist.tolist()]
+    else:
+        return dist.tolist()
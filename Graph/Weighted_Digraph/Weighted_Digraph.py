@@ -1,3 +1,5 @@
+from itertools import repeat
+
 class Weigthed_Digraph:
     """重み[付き]有向グラフを生成する.
 
@@ -42,6 +44,27 @@ class Weigthed_Digraph:
         self.arc_count += 1
         return id
 
+    #弧をまとめて追加したグラフ
+    @classmethod
+    def from_arcs(cls, N, S, T, W = None, arc_offset = 0):
+        """ 重み W[j] の弧 S[j] -> T[j] からなる N 頂点の重み付き有向グラフを, add_arc を呼ばずに一度に生成する.
+
+        S, T, W: 同じ長さの列 (Integer_Reader.read_columns の返り値など). W が None ならば重みは全て 1.
+        弧 j の id は arc_offset + j である.
+        """
+
+        D = cls(N, arc_offset)
+        adjacent_out = D.adjacent_out; adjacent_in = D.adjacent_in
+        if W is None:
+            W = repeat(1)
+
+        for id, (s, t, w) in enumerate(zip(S, T, W), arc_offset):
+            adjacent_out[s].append((t, w, id))
+            adjacent_in[t].append((s, w, id))
+
+        D.arc_count = len(S)
+        return D
+
     #近傍
 
     #出次数
@@ -78,6 +101,132 @@ class Weigthed_Digraph:
         """ グラフのサイズ (辺数) を求める. """
         return self.arc_count
 
+    def freeze(self, reverse = True):
+        """ CSR 形式で保持された変更不可能な重み付き有向グラフ (Frozen_Weigthed_Digraph) を生成する.
+
+        reverse: False にすると, 入近傍の情報を持たない (メモリ使用量が半分程度になる).
+        """
+
+        from array import array
+
+        N = self.order()
+
+        def weight_column(W):
+            # 整数ならば array('q'), 浮動小数点数ならば array('d'), それ以外はリストで持つ.
+            if all(type(w) is int for w in W):
+                try:
+                    return array('q', W)
+                except OverflowError:
+                    return W
+            elif all(type(w) is float for w in W):
+                return array('d', W)
+            else:
+                return W
+
+        def build(adjacent):
+            offset = array('q', [0]) * (N + 1)
+            for v in range(N):
+                offset[v + 1] = offset[v] + len(adjacent[v])
+
+            partner = array('i', [y for A in adjacent for y, _, _ in A])
+            weight = weight_column([w for A in adjacent for _, w, _ in A])
+            id = array('q', [j for A in adjacent for _, _, j in A])
+            return offset, partner, weight, id
+
+        out_columns = build(self.adjacent_out)
+        if reverse:
+            in_columns = build(self.adjacent_in)
+        else:
+            in_columns = (None, None, None, None)
+
+        return Frozen_Weigthed_Digraph(*out_columns, *in_columns, self.arc_offset, self.arc_count)
+
+#================================================
+# CSR 形式
+#================================================
+class CSR_Adjacent:
+    """ CSR 形式の隣接リストを, 頂点 v ごとに (相手, 重み, 番号) を yield するリストのように見せる. """
+
+    __slots__ = ("offset", "partner", "weight", "id")
+
+    def __init__(self, offset, partner, weight, id):
+        self.offset = offset
+        self.partner = partner
+        self.weight = weight
+        self.id = id
+
+    def __len__(self):
+        return len(self.offset) - 1
+
+    def __getitem__(self, v):
+        a = self.offset[v]; b = self.offset[v + 1]
+        return zip(self.partner[a: b], self.weight[a: b], self.id[a: b])
+
+class Frozen_Weigthed_Digraph:
+    """ CSR 形式で保持された変更不可能な重み付き有向グラフ (Weigthed_Digraph.freeze() で生成する).
+
+    頂点 v を始点とする弧は out_offset[v] <= i < out_offset[v + 1] の位置にあり, (終点, 重み, 番号) = (out_target[i], out_weight[i], out_id[i]) である.
+    頂点 v を終点とする弧も同様に in_offset, in_source, in_weight, in_id で表される.
+    """
+
+    __slots__ = ("out_offset", "out_target", "out_weight", "out_id",
+                 "in_offset", "in_source", "in_weight", "in_id",
+                 "arc_offset", "arc_count")
+
+    def __init__(self, out_offset, out_target, out_weight, out_id, in_offset, in_source, in_weight, in_id, arc_offset, arc_count):
+        self.out_offset = out_offset
+        self.out_target = out_target
+        self.out_weight = out_weight
+        self.out_id = out_id
+        self.in_offset = in_offset
+        self.in_source = in_source
+        self.in_weight = in_weight
+        self.in_id = in_id
+        self.arc_offset = arc_offset
+        self.arc_count = arc_count
+
+    @property
+    def adjacent_out(self):
+        return CSR_Adjacent(self.out_offset, self.out_target, self.out_weight, self.out_id)
+
+    @property
+    def adjacent_in(self):
+        assert self.has_reverse(), "入近傍の情報を持っていません (reverse=True で freeze してください)."
+        return CSR_Adjacent(self.in_offset, self.in_source, self.in_weight, self.in_id)
+
+    def has_reverse(self):
+        return self.in_offset is not None
+
+    #出次数
+    def out_degree(self, v):
+        return self.out_offset[v + 1] - self.out_offset[v]
+
+    #入次数
+    def in_degree(self, v):
+        assert self.has_reverse()
+        return self.in_offset[v + 1] - self.in_offset[v]
+
+    #次数
+    def degree(self, v):
+        return (self.out_degree(v), self.in_degree(v))
+
+    #相対次数
+    def relative_degree(self, v):
+        return self.out_degree(v) - self.in_degree(v)
+
+    #頂点数
+    def vertex_count(self):
+        """ グラフの頂点数 (位数) を求める."""
+        return len(self.out_offset) - 1
+
+    def order(self):
+        """ グラフの位数 (頂点数) を求める."""
+        return len(self.out_offset) - 1
+
+    def size(self):
+        """ グラフのサイズ (辺数) を求める. """
+        return self.arc_count
+
 #================================================
 #Dijkstra
 def Dijkstra_All(D, start, with_path=False):
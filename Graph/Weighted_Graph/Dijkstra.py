@@ -17,6 +17,7 @@ def Dijkstra(G: Weigthed_Graph, start: int, goal: int, default = None):
         if fix[x]:
             continue
 
+        fix[x] = True
         if x == goal:
             break
 
@@ -41,3 +42,76 @@ def Dijkstra(G: Weigthed_Graph, start: int, goal: int, default = None):
         vertex.append(x)
 
     return {'dist': dist[goal], 'arc': edge[::-1], 'vertex': vertex[::-1]}
+
+def Bidirectional_Dijkstra(G: Weigthed_Graph, start: int, goal: int, default = None):
+    """ 双方向 Dijkstra 法を用いて, start から goal への最短路を求める (返り値の形式は Dijkstra と同じ).
+
+    start と goal の両方から交互に探索し, 2 つの探索の距離の和が暫定の最短距離以上になったら終了する.
+
+    G: 辺の重みが全て非負の無向グラフ
+    """
+
+    from heapq import heappop, heappush
+
+    inf = float('inf')
+    N = G.vertex_count()
+
+    if start == goal:
+        return {'dist': 0, 'arc': [], 'vertex': [start]}
+
+    # 添字 0 が start からの探索, 添字 1 が goal からの探索
+    adjacent = G.adjacent
+    dist = ([inf] * N, [inf] * N)
+    fix = ([False] * N, [False] * N)
+    parent = ([None] * N, [None] * N)
+    upper = ([None] * N, [None] * N)
+    Q = ([(0, start)], [(0, goal)])
+
+    dist[0][start] = 0; dist[1][goal] = 0
+
+    best = inf; meet = -1
+    while Q[0] and Q[1]:
+        if Q[0][0][0] + Q[1][0][0] >= best:
+            break
+
+        side = 0 if Q[0][0][0] <= Q[1][0][0] else 1
+        dist_s = dist[side]; dist_t = dist[1 - side]
+        fix_s = fix[side]; parent_s = parent[side]; upper_s = upper[side]; Q_s = Q[side]
+
+        d, x = heappop(Q_s)
+        if fix_s[x]:
+            continue
+        fix_s[x] = True
+
+        for y, w, id in adjacent[x]:
+            e = d + w
+            if e < dist_s[y]:
+                dist_s[y] = e
+                parent_s[y] = x
+                upper_s[y] = id
+                heappush(Q_s, (e, y))
+
+            if e + dist_t[y] < best:
+                best = e + dist_t[y]
+                meet = y
+
+    if best == inf:
+        return {'dist': default, 'arc': None, 'vertex': None}
+
+    vertex = [meet]
+    edge = []
+    x = meet
+    while x != start:
+        edge.append(upper[0][x])
+        x = parent[0][x]
+        vertex.append(x)
+
+    vertex.reverse(); edge.reverse()
+
+    x = meet
+    while x != goal:
+        edge.append(upper[1][x])
+        x = parent[1][x]
+        vertex.append(x)
+
+    return {'dist': best, 'arc': edge, 'vertex': vertex}
@@ -4,14 +4,13 @@ def Hungarian(A, maximize = True):
     Args:
         A: 行列
         maximize (bool, optional): True ならば最大値, False ならば最小値を求める.
-        mode (bool, optional): _description_. Defaults to False.
 
     Reference:
         https://judge.yosupo.jp/submission/34963
     """
 
     if not maximize:
-        pre_sol = Hungarian(A, True)
+        pre_sol = Hungarian([[-a for a in row] for row in A], True)
         return { 'value': -pre_sol['value'], 'assignment': pre_sol['assignment'] }
 
     inf=1<<31
@@ -56,3 +55,213 @@ def Hungarian(A, maximize = True):
             i += 1
 
     return { 'value': sum(A[i][j] for i, j in enumerate(x)), 'assignment': x}
+
+def Hungarian_NumPy(A, maximize = True):
+    """ 行列 A に対して, 最短増加路法 (Jonker-Volgenant) を適用して, 割当問題の最適解を求める.
+
+    各行を順に追加し, 列のポテンシャルを保ったまま Dijkstra 法で最短増加路を探す. 双対変数の更新は NumPy の行演算で行う.
+    A は長方形 (N x M) でも良く, 要素は整数でも浮動小数点数でも良い.
+
+    Args:
+        A: 行列
+        maximize (bool, optional): True ならば最大値, False ならば最小値を求める.
+
+    Returns:
+        'value': 最適値, 'assignment': 第 i 要素は行 i に割り当てた列 (N > M で割り当てられない行は -1) の辞書.
+
+    計算量: O(N^2 M) Time (内側の O(M) は NumPy)
+    """
+
+    import numpy as np
+
+    C = np.array(A)
+    if C.size == 0:
+        return { 'value': 0, 'assignment': [-1] * len(A) }
+
+    if C.dtype.kind in 'iub':
+        C = C.astype(np.int64)
+        inf = 1 << 62
+    else:
+        C = C.astype(np.float64)
+        inf = np.inf
+
+    if maximize:
+        C = -C
+
+    N, M = C.shape
+    transposed = N > M
+    if transposed:
+        C = C.T
+        N, M = M, N
+
+    # 列 0 は番兵 (これから追加する行に割り当てられている扱い).
+    u = np.zeros(N + 1, dtype = C.dtype)
+    v = np.zeros(M + 1, dtype = C.dtype)
+    p = np.zeros(M + 1, dtype = np.int64)
+    way = np.zeros(M + 1, dtype = np.int64)
+
+    for i in range(1, N + 1):
+        p[0] = i
+        j0 = 0
+        minv = np.full(M + 1, inf, dtype = C.dtype)
+        used = np.zeros(M + 1, dtype = np.bool_)
+
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+
+            # 行 i0 の被約費用で, 未確定の列までの距離を更新する.
+            cur = C[i0 - 1] - u[i0] - v[1:]
+            better = (~used[1:]) & (cur < minv[1:])
+            minv[1:][better] = cur[better]
+            way[1:][better] = j0
+
+            masked = np.where(used[1:], inf, minv[1:])
+            j1 = int(masked.argmin()) + 1
+            delta = masked[j1 - 1]
+
+            u[p[used]] += delta
+            v[used] -= delta
+            minv[~used] -= delta
+
+            j0 = j1
+            if p[j0] == 0:
+                break
+
+        # 増加路に沿って割当を入れ替える.
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    if transposed:
+        assignment = [-1] * M
+        for j in range(1, M + 1):
+            if p[j]:
+                assignment[j - 1] = p[j] - 1
+    else:
+        assignment = [-1] * N
+        for j in range(1, M + 1):
+            if p[j]:
+                assignment[p[j] - 1] = j - 1
+
+    value = sum(A[i][j] for i, j in enumerate(assignment) if j != -1)
+    return { 'value': value, 'assignment': assignment }
+
+def Hungarian_Sparse(N, M, edges, maximize = True):
+    """ 疎な割当問題を最短増加路法 (Jonker-Volgenant) で解く.
+
+    行 i と列 j の間に費用 c の辺がある (i, j, c) の列 edges に対して, 全ての行に相異なる列を割り当てる (N <= M を仮定).
+    各行を順に追加し, 被約費用 c - u[i] - v[j] が非負になるポテンシャルを保ちながら, ヒープを用いた Dijkstra 法で最短増加路を探す.
+
+    Args:
+        N (int): 行の数
+        M (int): 列の数
+        edges: (行, 列, 費用) の列
+        maximize (bool, optional): True ならば最大値, False ならば最小値を求める.
+
+    Returns:
+        'value': 最適値, 'assignment': 第 i 要素は行 i に割り当てた列の辞書. 全ての行を割り当てられない場合は None.
+
+    計算量: O(N E log M) Time (E は辺の数)
+    """
+
+    from heapq import heappush, heappop
+
+    assert N <= M
+
+    sign = -1 if maximize else 1
+    offset = [0] * (N + 1)
+    edges = list(edges)
+    for i, _, _ in edges:
+        offset[i + 1] += 1
+    for i in range(N):
+        offset[i + 1] += offset[i]
+
+    column = [0] * len(edges); cost = [0] * len(edges)
+    position = offset[:-1]
+    for i, j, c in edges:
+        column[position[i]] = j
+        cost[position[i]] = sign * c
+        position[i] += 1
+
+    inf = float('inf')
+    u = [0] * N; v = [0] * M
+    x = [-1] * N; y = [-1] * M
+
+    dist = [inf] * M
+    pre = [-1] * M
+    done = [False] * M
+
+    for r in range(N):
+        if offset[r] == offset[r + 1]:
+            return None
+
+        # 新しい行の被約費用が非負になるように u[r] を決める.
+        u[r] = min(cost[k] - v[column[k]] for k in range(offset[r], offset[r + 1]))
+
+        touched = []
+        Q = []
+        for k in range(offset[r], offset[r + 1]):
+            j = column[k]
+            d = cost[k] - u[r] - v[j]
+            if d < dist[j]:
+                if dist[j] == inf:
+                    touched.append(j)
+                dist[j] = d; pre[j] = r
+                heappush(Q, (d, j))
+
+        finished = []
+        free = -1
+        while Q:
+            d, j = heappop(Q)
+            if done[j] or d > dist[j]:
+                continue
+
+            done[j] = True
+            finished.append(j)
+            i = y[j]
+            if i == -1:
+                free = j
+                break
+
+            # 行 i は列 j と被約費用 0 の辺でつながっているので, 距離 d で到達する.
+            for k in range(offset[i], offset[i + 1]):
+                l = column[k]
+                if done[l]:
+                    continue
+
+                e = d + cost[k] - u[i] - v[l]
+                if e < dist[l]:
+                    if dist[l] == inf:
+                        touched.append(l)
+                    dist[l] = e; pre[l] = i
+                    heappush(Q, (e, l))
+
+        if free == -1:
+            return None
+
+        # ポテンシャルを更新する (確定した列とその相手の行).
+        D = dist[free]
+        u[r] += D
+        for j in finished:
+            if j != free:
+                v[j] -= D - dist[j]
+                u[y[j]] += D - dist[j]
+
+        # 増加路に沿って割当を入れ替える.
+        j = free
+        while True:
+            i = pre[j]
+            next_j = x[i]
+            x[i] = j; y[j] = i
+            if i == r:
+                break
+            j = next_j
+
+        for j in touched:
+            dist[j] = inf; pre[j] = -1; done[j] = False
+
+    # 多重辺がある場合は, 最も良い辺を使っている.
+    value = sign * sum(min(cost[k] for k in range(offset[i], offset[i + 1]) if column[k] == x[i]) for i in range(N))
+    return { 'value': value, 'assignment': x }
@@ -24,6 +24,21 @@ class Bipartite_Weighted_Matching:
             self.N+=k
             return list(range(self.N-k, self.N))
 
+    @staticmethod
+    def __expand_slope(g):
+        """ 折れ点のリスト g を, 各流量に対する値のリストに展開する. """
+
+        X=[0]
+        for (f0,c0),(f1,c1) in zip(g,g[1:]):
+            # 整数のときは割り切れるので, 整数のまま展開する.
+            exact=isinstance(c0,int) and isinstance(c1,int) and (c1-c0)%(f1-f0)==0
+            for k in range(1,f1-f0+1):
+                if exact:
+                    X.append(c0+(c1-c0)//(f1-f0)*k)
+                else:
+                    X.append(c0+(c1-c0)*k/(f1-f0))
+        return X
+
     def add_edge(self, a, b, w):
         """ 重さ w の 辺 Aa Bb を加える.
 
@@ -69,7 +84,7 @@ class Bipartite_Weighted_Matching:
             for b,w in self.edge[a]:
                 G.add_arc(a, b+M, 1, w)
 
-        return G.slope(source, target, min(M,N))
+        return self.__expand_slope(G.slope(source, target, min(M,N)))
 
     def matching_vertex_duplicate(self, k, l, mode=0):
         """ 頂点 Aa の選択を k[a] 回, 頂点 Bb の選択を l[b] 回まで許す最大マッチングを選ぶ.
@@ -135,4 +150,4 @@ class Bipartite_Weighted_Matching:
             for b,w in self.edge[a]:
                 G.add_arc(a, b+M, 1, w)
 
-        return G.slope(source, target)
+        return self.__expand_slope(G.slope(source, target))
@@ -1,21 +1,81 @@
 from heapq import heappush, heappop
+from array import array
+
 class Min_Cost_Flow:
     #最小費用流問題
 
     inf=float("inf")
 
+    class Residual_Graph:
+        """ 残余グラフを平行な配列で持つ.
+
+        弧 i の順方向の番号は 2i, 逆方向の番号は 2i+1 であり, 互いの逆弧は e^1 で求まる.
+        to[e]: 弧 e の終点, cap[e]: 弧 e の残余容量, cost[e]: 弧 e の費用, base[i]: 弧 i の容量
+        adjacent[v]: v を始点とする弧の番号の配列
+        """
+
+        __slots__=("adjacent", "to", "cap", "cost", "base")
+
+        def __init__(self, N=0):
+            self.adjacent=[array('q') for _ in range(N)]
+            self.to=array('q')
+            self.cap=[]
+            self.cost=[]
+            self.base=[]
+
+        def add_vertices(self, k):
+            self.adjacent.extend([array('q') for _ in range(k)])
+
+        def add_arc(self, v, w, cap, cost):
+            m=len(self.base)
+            self.adjacent[v].append(2*m)
+            self.adjacent[w].append(2*m+1)
+            self.to.append(w); self.to.append(v)
+            self.cap.append(cap); self.cap.append(0)
+            self.cost.append(cost); self.cost.append(-cost)
+            self.base.append(cap)
+            return m
+
     class Arc:
-        __slots__=("source", "target", "cap", "base", "rev", "cost", "direction", "id")
-
-        def __init__(self, source, target, cap, base, cost, direction, id):
-            self.source=source
-            self.target=target
-            self.cap=cap
-            self.base=base
-            self.cost=cost
-            self.rev=None
-            self.direction=direction
-            self.id=id
+        """ 弧 (残余グラフの弧 index の view) """
+
+        __slots__=("__graph", "__index")
+
+        def __init__(self, graph, index):
+            self.__graph=graph
+            self.__index=index
+
+        @property
+        def source(self):
+            return self.__graph.to[self.__index^1]
+
+        @property
+        def target(self):
+            return self.__graph.to[self.__index]
+
+        @property
+        def cap(self):
+            return self.__graph.cap[self.__index]
+
+        @property
+        def base(self):
+            return self.__graph.base[self.__index>>1]
+
+        @property
+        def cost(self):
+            return self.__graph.cost[self.__index]
+
+        @property
+        def rev(self):
+            return Min_Cost_Flow.Arc(self.__graph, self.__index^1)
+
+        @property
+        def direction(self):
+            return -1 if self.__index&1 else 1
+
+        @property
+        def id(self):
+            return self.__index>>1
 
         def __repr__(self):
             if self.direction==1:
@@ -29,19 +89,18 @@ class Min_Cost_Flow:
         N: int
         objective: -1 のとき, 最大値になる.
         """
-        self.arc=[[] for _ in range(N)]
-        self.__arc_list=[]
+        self.residual=Min_Cost_Flow.Residual_Graph(N)
         self.__objective=objective
         self.__is_DAG=None
         self.__has_negative=False
 
     def add_vertex(self):
-        self.arc.append([])
+        self.residual.add_vertices(1)
         return self.vertex_count()-1
 
     def add_vertices(self, k):
         n=self.vertex_count()
-        self.arc.extend([[] for _ in range(k)])
+        self.residual.add_vertices(k)
         return list(range(n,n+k))
 
     def add_arc(self, v, w, cap, cost):
@@ -53,48 +112,40 @@ class Min_Cost_Flow:
         cost: 費用
         """
 
-        m=len(self.__arc_list)
-        a=self.Arc(v, w, cap, cap, self.__objective*cost, 1, m)
-        b=self.Arc(w, v, 0, cap, -self.__objective*cost, -1, m)
-        a.rev=b
-        b.rev=a
-        self.arc[v].append(a)
-        self.arc[w].append(b)
-        self.__arc_list.append(a)
-
-        return m
+        return self.residual.add_arc(v, w, cap, self.__objective*cost)
 
     def get_arc(self, i, mode=0):
-        """ i 番目の辺の情報を得る.
+        """ i 番目の辺の情報を得る (残余グラフの view).
 
         """
-        assert 0<=i<len(self.__arc_list)
-        a=self.__arc_list[i]
+        assert 0<=i<self.arc_count()
+        a=self.Arc(self.residual, 2*i)
         if mode:
             return a,a.rev
         else:
             return a
 
     def get_all_arcs(self):
-        return [self.get_arc(i) for i in range(len(self.__arc_list))]
+        return [self.get_arc(i) for i in range(self.arc_count())]
 
     def vertex_count(self):
-        return len(self.arc)
+        return len(self.residual.adjacent)
 
     def arc_count(self):
-        return len(self.__arc_list)
+        return len(self.residual.base)
 
     def change_arc(self, i, new_cap, new_flow, new_cost):
         """ i 番目の辺の情報を変更する.
 
         """
 
-        assert 0<=i<len(self.__arc_list)
+        assert 0<=i<self.arc_count()
         assert 0<=new_flow<=new_cap
 
-        a=self.__arc_list[i]
-        a.base=new_cap; a.cap=new_cap-new_flow
-        a.rev.base=new_cap; a.rev.cap=new_flow
+        R=self.residual
+        R.base[i]=new_cap
+        R.cap[2*i]=new_cap-new_flow; R.cap[2*i+1]=new_flow
+        R.cost[2*i]=self.__objective*new_cost; R.cost[2*i+1]=-self.__objective*new_cost
 
     def __potential_by_Dijkstra(self, s):
         """ s を基準とするポテンシャルを Dijkstra 法によって求める.
@@ -104,24 +155,28 @@ class Min_Cost_Flow:
 
         inf=Min_Cost_Flow.inf
         N=self.vertex_count()
-        self.__pre_v=[-1]*N
-        self.__pre_e=[None]*N
-        self.__dist=[inf]*N; self.__dist[s]=0
+        adjacent=self.residual.adjacent; to=self.residual.to; cap=self.residual.cap; cost=self.residual.cost
+        pot=self.__pot
+        pre_e=self.__pre_e=[-1]*N
+        dist=self.__dist=[inf]*N; dist[s]=0
 
         Q=[(0,s)]
         while Q:
             d,v=heappop(Q)
 
-            if d>self.__dist[v]:
+            if d>dist[v]:
                 continue
 
-            for a in self.arc[v]:
-                w=a.target
-                if a.cap>0 and self.__dist[w]>d+self.__pot[v]-self.__pot[w]+a.cost:
-                    self.__dist[w]=d+self.__pot[v]-self.__pot[w]+a.cost
-                    self.__pre_v[w]=v
-                    self.__pre_e[w]=a
-                    heappush(Q, (self.__dist[w],w))
+            dv=d+pot[v]
+            for e in adjacent[v]:
+                if cap[e]==0:
+                    continue
+
+                w=to[e]
+                if dist[w]>dv-pot[w]+cost[e]:
+                    dist[w]=dv-pot[w]+cost[e]
+                    pre_e[w]=e
+                    heappush(Q, (dist[w],w))
         return
 
     def __potential_for_DAG(self, s):
@@ -132,24 +187,29 @@ class Min_Cost_Flow:
 
         inf=Min_Cost_Flow.inf
         N=self.vertex_count()
+        adjacent=self.residual.adjacent; to=self.residual.to; cost=self.residual.cost
 
-        self.__pre_v=[-1]*N
-        self.__pre_e=[None]*N
-        self.__dist=[inf]*N; self.__dist[s]=0
+        pre_e=self.__pre_e=[-1]*N
+        dist=self.__dist=[inf]*N; dist[s]=0
 
         for v in self.__top_sort:
-            for a in self.arc[v]:
-                w=a.target
-                if a.direction==1 and self.__dist[w]>self.__dist[v]+a.cost:
-                    self.__dist[w]=self.__dist[v]+a.cost
-                    self.__pre_v[w]=v
-                    self.__pre_e[w]=a
+            dv=dist[v]
+            if dv==inf:
+                continue
+
+            for e in adjacent[v]:
+                w=to[e]
+                if e&1==0 and dist[w]>dv+cost[e]:
+                    dist[w]=dv+cost[e]
+                    pre_e[w]=e
 
     def __topological_sort(self):
         N=self.vertex_count()
+        adjacent=self.residual.adjacent; to=self.residual.to
+
         in_deg=[0]*N
-        for i in range(self.arc_count()):
-            in_deg[self.__arc_list[i].target]+=1
+        for e in range(0, len(to), 2):
+            in_deg[to[e]]+=1
 
         Q=[v for v in range(N) if in_deg[v]==0]
         T=[]
@@ -157,9 +217,9 @@ class Min_Cost_Flow:
             v=Q.pop()
             T.append(v)
 
-            for a in self.arc[v]:
-                w=a.target
-                if a.direction==1:
+            for e in adjacent[v]:
+                if e&1==0:
+                    w=to[e]
                     in_deg[w]-=1
                     if in_deg[w]==0:
                         Q.append(w)
@@ -187,15 +247,30 @@ class Min_Cost_Flow:
             self.__potential_by_Dijkstra(s)
         return
 
-    def flow(self, source, target, flow):
+    def flow(self, source, target, flow, method=None):
         """ 頂点 s から頂点 t へ新たに流量 f を流す際の最小費用を求める.
 
         source: 始点
         target: 終点
         flow: 流量
+        method: "ssp" (逐次最短路法) or "simplex" (ネットワーク単体法), None のときは流量が大きく, かつ負の費用の弧が無い場合に "simplex" にする.
+
+        ※ 負の費用の閉路がある場合, "simplex" はその閉路にも流す (閉路を含めた最小費用を求める) が, "ssp" は閉路に流さない.
         """
         assert 0<=flow
-        return self.slope(source, target, flow)[-1]
+
+        if method is None:
+            # 負の費用の弧がある場合は, 流量によって答えが変わらないように, 常に逐次最短路法を用いる.
+            R=self.residual
+            if flow>self.vertex_count() and all(R.cost[2*i]>=0 for i in range(self.arc_count())):
+                method="simplex"
+            else:
+                method="ssp"
+
+        if method=="simplex":
+            return self.__objective*self.__network_simplex(source, target, flow)[1]
+        else:
+            return self.slope(source, target, flow)[-1][1]
 
     def slope(self, source, target, flow=-1):
         """ 流量と最小コストの関係図折れ線を出力する.
@@ -203,6 +278,8 @@ class Min_Cost_Flow:
         source: 始点
         target: 終点
         flow: 流量
+
+        返り値は折れ線の折れ点 (流量, コスト) のリストであり, (0, 0) から始まる. 折れ点の間は線形である.
         """
 
         assert 0<=source<self.vertex_count()
@@ -211,9 +288,11 @@ class Min_Cost_Flow:
 
 
         N=self.vertex_count(); inf=Min_Cost_Flow.inf
+        to=self.residual.to; cap=self.residual.cap
         self.__pot=[0]*N
 
-        g=[0]
+        g=[(0,0)]
+        flow_total=0; cost_total=0; last=None
 
         if flow<0:
             flow=Min_Cost_Flow.inf
@@ -221,42 +300,237 @@ class Min_Cost_Flow:
         while flow:
             self.__potential(source)
 
-            if self.__dist[target]==inf:
+            dist=self.__dist; pre_e=self.__pre_e; pot=self.__pot
+            if dist[target]==inf:
                 break
 
             for v in range(N):
-                self.__pot[v]+=self.__dist[v]
+                if dist[v]<inf:
+                    pot[v]+=dist[v]
 
             push=flow; u=target
             while u!=source:
-                push=min(push, self.__pre_e[u].cap)
-                u=self.__pre_v[u]
+                e=pre_e[u]
+                push=min(push, cap[e])
+                u=to[e^1]
 
             flow-=push
+            if push==0:
+                continue
 
-            for _ in range(push):
-                g.append(g[-1]+self.__objective*self.__pot[target])
+            # 傾きが変わらない場合は, 最後の折れ点を伸ばす.
+            unit=self.__objective*pot[target]
+            flow_total+=push; cost_total+=push*unit
+            if unit==last:
+                g[-1]=(flow_total, cost_total)
+            else:
+                g.append((flow_total, cost_total))
+            last=unit
 
             u=target
             while u!=source:
-                a=self.__pre_e[u]
-                a.cap-=push; a.rev.cap+=push
-                u=self.__pre_v[u]
+                e=pre_e[u]
+                cap[e]-=push; cap[e^1]+=push
+                u=to[e^1]
         return g
 
+    def __network_simplex(self, source, target, flow):
+        """ ネットワーク単体法によって, source から target へ新たに流量 flow (最大流がそれより小さい場合は最大流) を流す.
+
+        残余容量が正の弧 (逆弧も含む) を変数とし, 根 r=N と各頂点を結ぶ人工弧 (費用 M) を初期の全域木とする.
+        M は任意の単純路の費用の絶対値より大きくとるので, source -> r -> target の人工弧に残る流量は流せなかった分である.
+        入る弧はブロック探索で選び, 出る弧は強実行可能木を保つように選ぶ.
+
+        返り値: (流した量, 費用 (内部の符号))
+        """
+
+        assert 0<=source<self.vertex_count()
+        assert 0<=target<self.vertex_count()
+        assert source!=target
+
+        N=self.vertex_count(); inf=Min_Cost_Flow.inf
+        R=self.residual
+        to=R.to; res=R.cap; res_cost=R.cost
+
+        # 変数とする弧 (残余グラフの弧の番号)
+        E=[e for e in range(len(to)) if res[e]>0]
+        tail=[to[e^1] for e in E]; head=[to[e] for e in E]
+        cap=[res[e] for e in E]; cost=[res_cost[e] for e in E]
+
+        if flow==inf or flow<0:
+            flow=min(sum(c for t,c in zip(tail,cap) if t==source), sum(c for h,c in zip(head,cap) if h==target))
+        assert flow<inf
+
+        M=1+sum(abs(c) for c in cost)
+        m=len(E); r=N
+
+        # 人工弧 m+v: source は v -> r (費用 M), target は r -> v (費用 M), その他は v -> r (費用 2M, 流量 0).
+        # その他の頂点の人工弧は, source -> v -> r -> target が source -> r -> target より高くなるように 2M にする.
+        for v in range(N):
+            if v==target:
+                tail.append(r); head.append(v)
+            else:
+                tail.append(v); head.append(r)
+            cap.append(inf); cost.append(M if v==source or v==target else 2*M)
+
+        x=[0]*(m+N)
+        x[m+source]=flow; x[m+target]=flow
+
+        # state: 1 (下限), -1 (上限), 0 (木)
+        state=[1]*m+[0]*N
+
+        parent=[r]*N+[-1]; pred=list(range(m, m+N))+[-1]
+        depth=[1]*N+[0]
+        pi=[0]*(N+1)
+        children=[set() for _ in range(N+1)]
+        children[r]=set(range(N))
+        for v in range(N):
+            # 木の弧の簡約費用 cost+pi[tail]-pi[head] が 0 になるようにする.
+            pi[v]=cost[m+v] if v==target else -cost[m+v]
+
+        block=max(int((m+N)**0.5), 10)
+        start=0
+
+        while True:
+            # 入る弧をブロック探索で選ぶ.
+            best=0; in_arc=-1
+            count=0; e=start
+            for _ in range(m+N):
+                s=state[e]
+                if s:
+                    c=s*(cost[e]+pi[tail[e]]-pi[head[e]])
+                    if c<best:
+                        best=c; in_arc=e
+                count+=1
+                e+=1
+                if e==m+N:
+                    e=0
+                if count>=block and in_arc>=0:
+                    break
+
+            if in_arc==-1:
+                break
+            start=e
+
+            if state[in_arc]==1:
+                first=tail[in_arc]; second=head[in_arc]
+            else:
+                first=head[in_arc]; second=tail[in_arc]
+
+            # first と second の合流点
+            u=first; v=second
+            while u!=v:
+                if depth[u]>depth[v]:
+                    u=parent[u]
+                elif depth[u]<depth[v]:
+                    v=parent[v]
+                else:
+                    u=parent[u]; v=parent[v]
+            join=u
+
+            # 出る弧を選ぶ.
+            delta=cap[in_arc]; u_out=-1; side=0
+            u=first
+            while u!=join:
+                a=pred[u]
+                d=x[a] if tail[a]==u else cap[a]-x[a]
+                if d<delta:
+                    delta=d; u_out=u; side=1
+                u=parent[u]
+
+            u=second
+            while u!=join:
+                a=pred[u]
+                d=cap[a]-x[a] if tail[a]==u else x[a]
+                if d<=delta:
+                    delta=d; u_out=u; side=2
+                u=parent[u]
+
+            assert delta<inf, "負の費用の閉路の容量が無限大"
+
+            # 閉路に沿って delta 流す.
+            if delta:
+                x[in_arc]+=state[in_arc]*delta
+                u=first
+                while u!=join:
+                    a=pred[u]
+                    if tail[a]==u:
+                        x[a]-=delta
+                    else:
+                        x[a]+=delta
+                    u=parent[u]
+
+                u=second
+                while u!=join:
+                    a=pred[u]
+                    if tail[a]==u:
+                        x[a]+=delta
+                    else:
+                        x[a]-=delta
+                    u=parent[u]
+
+            if side==0:
+                state[in_arc]=-state[in_arc]
+                continue
+
+            out_arc=pred[u_out]
+            state[out_arc]=1 if x[out_arc]==0 else -1
+            state[in_arc]=0
+
+            # u_out 以下の部分木を付け替える (u_out から y への路の向きを反転する).
+            if side==1:
+                y=first; z=second
+            else:
+                y=second; z=first
+
+            new_parent=z; new_pred=in_arc; w=y
+            while True:
+                p=parent[w]; a=pred[w]
+                children[p].discard(w)
+                parent[w]=new_parent; pred[w]=new_pred
+                children[new_parent].add(w)
+                if w==u_out:
+                    break
+                new_parent=w; new_pred=a; w=p
+
+            # 部分木の深さとポテンシャルを更新する.
+            stack=[y]
+            while stack:
+                w=stack.pop()
+                p=parent[w]; a=pred[w]
+                depth[w]=depth[p]+1
+                if tail[a]==w:
+                    pi[w]=pi[p]-cost[a]
+                else:
+                    pi[w]=pi[p]+cost[a]
+                stack.extend(children[w])
+
+        # 流量を残余グラフに書き戻す.
+        total=0
+        for k in range(m):
+            if x[k]:
+                e=E[k]
+                res[e]-=x[k]; res[e^1]+=x[k]
+                total+=x[k]*cost[k]
+
+        sent=flow-x[m+source]
+        return sent,total
+
     def get_flow(self, mode=0):
+        R=self.residual
         if mode==0:
-            return [a.base-a.cap for a in self.__arc_list]
+            return [R.base[i]-R.cap[2*i] for i in range(self.arc_count())]
         else:
             F=[[] for _ in range(self.vertex_count())]
-            for i,a in enumerate(self.__arc_list):
-                F[a.source].append((i,a.target,a.base-a.cap))
+            for i in range(self.arc_count()):
+                F[R.to[2*i+1]].append((i,R.to[2*i],R.base[i]-R.cap[2*i]))
             return F
 
     def refresh(self):
-        for a in self.__arc_list:
-            a.cap=a.base
-            a.rev.cap=0
+        R=self.residual
+        for i in range(self.arc_count()):
+            R.cap[2*i]=R.base[i]
+            R.cap[2*i+1]=0
 
 class Max_Gain_Flow(Min_Cost_Flow):
     def __init__(self, N=0):
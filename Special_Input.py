@@ -37,3 +37,62 @@ def Decimal_to_Int(s: str, k: int, base=10) -> int:
 
     m=s.index(".")
     return int(s.replace(".",""))*pow(base,k-(len(s)-m-1))
+
+#入力全体を整数の配列として読む.
+class Integer_Reader:
+    """ 入力全体を一度に整数の配列に変換し, 先頭から順に読む.
+
+    辺のリストのような大量の整数を, 行ごとの input().split() を使わずに読むためのもの.
+    """
+
+    __slots__ = ("data", "position")
+
+    def __init__(self, source = None):
+        """ source: None ならば標準入力 (sys.stdin.buffer) 全体, bytes ならばそのバイト列, str ならばそのパスのファイル (mmap で読む).
+        """
+
+        if source is None:
+            import sys
+            buffer = sys.stdin.buffer.read()
+        elif isinstance(source, str):
+            import mmap
+            with open(source, "rb") as file:
+                try:
+                    with mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ) as m:
+                        buffer = m[:]
+                except ValueError:
+                    # 空のファイルは mmap できない.
+                    buffer = b""
+        else:
+            buffer = bytes(source)
+
+        self.data = list(map(int, buffer.split()))
+        self.position = 0
+
+    def __len__(self):
+        """ まだ読んでいない整数の個数 """
+        return len(self.data) - self.position
+
+    def read(self) -> int:
+        """ 整数を 1 個読む. """
+
+        x = self.data[self.position]
+        self.position += 1
+        return x
+
+    def read_many(self, k: int):
+        """ 整数を k 個読む (リストで返す). """
+
+        p = self.position
+        self.position = p + k
+        return self.data[p: p + k]
+
+    def read_columns(self, k: int, width: int):
+        """ width 個の整数からなる行を k 行読み, 列ごとのリスト (長さ k) のリストを返す.
+
+        例: 辺のリスト "u v w" が M 行ならば, U, V, W = reader.read_columns(M, 3)
+        """
+
+        p = self.position
+        self.position = p + k * width
+        return [self.data[p + i: p + k * width: width] for i in range(width)]
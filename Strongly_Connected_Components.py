@@ -7,7 +7,6 @@ class Strongly_Connected_Components:
         """
 
         self.arc: list[list[int]] = [[] for _ in range(N)]
-        self.rev: list[list[int]] = [[] for _ in range(N)]
 
     @property
     def N(self):
@@ -21,7 +20,6 @@ class Strongly_Connected_Components:
         """
 
         self.arc.append([])
-        self.rev.append([])
         return self.N - 1
 
     def add_vertices(self, k: int = 1) -> list[int]:
@@ -35,7 +33,6 @@ class Strongly_Connected_Components:
         """
 
         self.arc.extend([[] for _ in range(k)])
-        self.rev.extend([[] for _ in range(k)])
         return list(range(self.N - k, self.N))
 
     def add_arc(self, source: int, target: int):
@@ -47,67 +44,21 @@ class Strongly_Connected_Components:
         """
 
         self.arc[source].append(target)
-        self.rev[target].append(source)
 
     def decomposition(self):
-        """有向グラフを強連結成分に分解"""
+        """ 有向グラフを強連結成分に分解する (成分の番号はトポロジカル順である). """
 
-        group = [0] * self.N
-        D = [False] * self.N
-        O = []
+        N = self.N
+        offset, target = Adjacent_to_CSR(self.arc)
+        group, k = Strongly_Connected_Components_CSR(N, offset, target)
 
-        # 1st DFS
-        for v in range(self.N):
-            if group[v] != 0:
-                continue
-
-            stack = [~v, v]
-
-            while stack:
-                v = stack.pop()
-                if v >= 0:
-                    # in
-                    if group[v] == -1:
-                        continue
-
-                    group[v] = -1
-                    for w in self.arc[v]:
-                        if not group[w]:
-                            stack.append(~w)
-                            stack.append(w)
-                else:
-                    # out
-                    v = ~v
-                    if D[v]:
-                        continue
-
-                    D[v] = True
-                    O.append(v)
-
-        components = []
-        # 2nd DFS
-        for v in reversed(O):
-            if group[v] != -1:
-                continue
-
-            stack = [v]
-            component = [v]
-            group[v] = len(components)
-
-            while stack:
-                w = stack.pop()
-                for u in self.rev[w]:
-                    if group[u] != -1:
-                        continue
-
-                    group[u] = len(components)
-                    component.append(u)
-                    stack.append(u)
-
-            components.append(component)
+        components = [[] for _ in range(k)]
+        for v in range(N):
+            components[group[v]].append(v)
 
         self.__components = components
-        self.__group = group
+        self.__group = list(group)
+        self.__condensation = Condensation_CSR(N, offset, target, group, k)
 
     @property
     def components(self) -> list[list[int]]:
@@ -116,3 +67,180 @@ class Strongly_Connected_Components:
     @property
     def group(self) -> list[int]:
         return self.__group
+
+    @property
+    def condensation(self) -> tuple:
+        """ 強連結成分を 1 頂点に縮約した DAG を CSR 形式 (offset, target) で返す (多重弧は持たない).
+
+        成分 c から出る弧の終点は target[offset[c]: offset[c + 1]] であり, 全て c より大きい.
+        """
+
+        return self.__condensation
+
+#==================================================
+# CSR 形式
+#==================================================
+def Adjacent_to_CSR(adjacent: list[list[int]]) -> tuple:
+    """ 隣接リストを CSR 形式 (offset, target) に変換する.
+
+    Args:
+        adjacent (list[list[int]]): 隣接リスト
+
+    Returns:
+        tuple: v の出近傍が target[offset[v]: offset[v + 1]] になる (offset, target)
+    """
+
+    from array import array
+
+    N = len(adjacent)
+    offset = array('q', [0]) * (N + 1)
+    for v in range(N):
+        offset[v + 1] = offset[v] + len(adjacent[v])
+
+    target = array('i', [w for A in adjacent for w in A])
+    return offset, target
+
+def Arc_List_to_CSR(N: int, source, target) -> tuple:
+    """ 弧のリスト (source[j] -> target[j]) を CSR 形式 (offset, target) に変換する.
+
+    Args:
+        N (int): 頂点数
+        source: 弧の始点の列
+        target: 弧の終点の列
+
+    Returns:
+        tuple: v の出近傍が csr_target[offset[v]: offset[v + 1]] になる (offset, csr_target)
+    """
+
+    from array import array
+    from itertools import accumulate
+
+    count = [0] * (N + 1)
+    for u in source:
+        count[u + 1] += 1
+    offset = array('q', accumulate(count))
+    del count
+
+    position = offset.tolist()
+    csr_target = array('i', [0]) * len(source)
+    for u, v in zip(source, target):
+        csr_target[position[u]] = v
+        position[u] += 1
+
+    return offset, csr_target
+
+def Strongly_Connected_Components_CSR(N: int, offset, target) -> tuple:
+    """ CSR 形式の有向グラフを, 非再帰の Tarjan 法 (Pearce による省メモリ版) で強連結成分に分解する.
+
+    Args:
+        N (int): 頂点数
+        offset: v の出近傍が target[offset[v]: offset[v + 1]] になる列 (長さ N + 1)
+        target: 弧の終点の列
+
+    Returns:
+        tuple: (group, k). group[v] は v が属する強連結成分の番号, k は強連結成分の個数.
+               成分の番号はトポロジカル順である (u から v への弧があれば group[u] <= group[v]).
+    """
+
+    from array import array
+
+    # Pearce の方法: rindex[v] は訪問中は訪問順 (low link を兼ねる), 成分の確定後は c (N - 1 から減少) になる. 0 は未訪問を表す.
+    rindex = array('i', [0]) * N
+    root = bytearray(N)
+    it = offset[:N]
+
+    stack = []; call = []
+    index = 1; c = N - 1
+    for s in range(N):
+        if rindex[s]:
+            continue
+
+        rindex[s] = index; index += 1; root[s] = 1
+        call.append(s)
+        while call:
+            v = call[-1]
+            i = it[v]; end = offset[v + 1]
+            rv = rindex[v]
+            while i < end:
+                w = target[i]; i += 1
+                rw = rindex[w]
+                if rw == 0:
+                    break
+
+                if rw < rv:
+                    rv = rw; root[v] = 0
+            else:
+                # v の探索を終える.
+                rindex[v] = rv
+                call.pop()
+                if root[v]:
+                    index -= 1
+                    while stack and rv <= rindex[stack[-1]]:
+                        rindex[stack.pop()] = c
+                        index -= 1
+                    rindex[v] = c
+                    c -= 1
+                else:
+                    stack.append(v)
+
+                if call:
+                    u = call[-1]
+                    if rindex[v] < rindex[u]:
+                        rindex[u] = rindex[v]; root[u] = 0
+                continue
+
+            # w に潜る.
+            rindex[v] = rv
+            it[v] = i
+            rindex[w] = index; index += 1; root[w] = 1
+            call.append(w)
+
+    # 成分はトポロジカル順の逆順に確定するので, c + 1 を引くとトポロジカル順の番号になる.
+    k = N - 1 - c
+    for v in range(N):
+        rindex[v] -= c + 1
+
+    return rindex, k
+
+def Condensation_CSR(N: int, offset, target, group, k: int) -> tuple:
+    """ 強連結成分を 1 頂点に縮約した DAG を CSR 形式で求める (多重弧は除く).
+
+    Args:
+        N (int): 頂点数
+        offset, target: 元の有向グラフの CSR 形式
+        group: 各頂点が属する強連結成分の番号
+        k (int): 強連結成分の個数
+
+    Returns:
+        tuple: 成分 c から出る弧の終点が condensation_target[condensation_offset[c]: condensation_offset[c + 1]] になる (condensation_offset, condensation_target)
+    """
+
+    from array import array
+
+    # 頂点を成分ごとに並べる.
+    member_offset = array('q', [0]) * (k + 1)
+    for v in range(N):
+        member_offset[group[v] + 1] += 1
+    for c in range(k):
+        member_offset[c + 1] += member_offset[c]
+
+    position = member_offset[:k]
+    member = array('i', [0]) * N
+    for v in range(N):
+        member[position[group[v]]] = v
+        position[group[v]] += 1
+
+    condensation_offset = array('q', [0]) * (k + 1)
+    condensation_target = array('i')
+    seen = array('i', [-1]) * k
+    for c in range(k):
+        for j in range(member_offset[c], member_offset[c + 1]):
+            v = member[j]
+            for i in range(offset[v], offset[v + 1]):
+                d = group[target[i]]
+                if d != c and seen[d] != c:
+                    seen[d] = c
+                    condensation_target.append(d)
+        condensation_offset[c + 1] = len(condensation_target)
+
+    return condensation_offset, condensation_target
@@ -102,3 +102,134 @@ class Topological_Sort:
     @property
     def order(self):
         return self.__order
+
+class Online_Topological_Sort:
+    __slots__=("__arc", "__rev", "__position", "__vertex", "__visited", "__stamp", "__cycle_arc")
+
+    def __init__(self, N: int):
+        """ N 頂点からなる有向空グラフを生成し, 弧を追加するたびにトポロジカル順序を更新する (Pearce-Kelly 法).
+
+        Args:
+            N (int): 頂点数
+        """
+
+        self.__arc=[[] for _ in range(N)]
+        self.__rev=[[] for _ in range(N)]
+
+        # position[v]: v の順位, vertex[i]: 順位が i の頂点
+        self.__position=list(range(N))
+        self.__vertex=list(range(N))
+
+        self.__visited=[0]*N
+        self.__stamp=0
+        self.__cycle_arc=None
+
+    @property
+    def N(self):
+        return len(self.__arc)
+
+    def add_vertex(self) -> int:
+        """ 1 頂点追加 (順位は最後になる).
+
+        Returns:
+            int: 追加された頂点の頂点番号
+        """
+
+        v=self.N
+        self.__arc.append([])
+        self.__rev.append([])
+        self.__position.append(v)
+        self.__vertex.append(v)
+        self.__visited.append(0)
+        return v
+
+    def add_arc(self, source: int, target: int) -> bool:
+        """ source から target への弧を追加し, トポロジカル順序を更新する.
+
+        弧を追加すると有向サイクルができる場合, 弧は追加せずに False を返す (最初に棄却された弧は cycle_arc で参照できる).
+
+        Args:
+            source (int): 始点
+            target (int): 終点
+
+        Returns:
+            bool: 弧を追加したならば True
+        """
+
+        if source==target:
+            return self.__reject(source, target)
+
+        position=self.__position
+        lower=position[target]; upper=position[source]
+
+        if upper<lower:
+            self.__arc[source].append(target)
+            self.__rev[target].append(source)
+            return True
+
+        # 順位が [lower, upper] の範囲だけを探索する.
+        self.__stamp+=1
+        stamp=self.__stamp
+        visited=self.__visited
+
+        # target から前向きに探索し, source に到達したらサイクルができる.
+        forward=[target]; visited[target]=stamp
+        stack=[target]
+        while stack:
+            x=stack.pop()
+            for y in self.__arc[x]:
+                if y==source:
+                    return self.__reject(source, target)
+
+                if visited[y]!=stamp and position[y]<upper:
+                    visited[y]=stamp
+                    forward.append(y)
+                    stack.append(y)
+
+        # source から後ろ向きに探索する.
+        backward=[source]; visited[source]=stamp
+        stack=[source]
+        while stack:
+            x=stack.pop()
+            for y in self.__rev[x]:
+                if visited[y]!=stamp and lower<position[y]:
+                    visited[y]=stamp
+                    backward.append(y)
+                    stack.append(y)
+
+        # backward, forward の順に, 元々使っていた順位を小さい方から割り当て直す.
+        backward.sort(key=position.__getitem__)
+        forward.sort(key=position.__getitem__)
+        moved=backward+forward
+        slots=sorted(position[x] for x in moved)
+
+        vertex=self.__vertex
+        for x, i in zip(moved, slots):
+            position[x]=i
+            vertex[i]=x
+
+        self.__arc[source].append(target)
+        self.__rev[target].append(source)
+        return True
+
+    def __reject(self, source: int, target: int) -> bool:
+        if self.__cycle_arc is None:
+            self.__cycle_arc=(source, target)
+        return False
+
+    @property
+    def order(self) -> list[int]:
+        """ 現在のトポロジカル順序 (頂点のリスト) """
+
+        return self.__vertex[:]
+
+    def position(self, v: int) -> int:
+        """ 現在のトポロジカル順序における頂点 v の順位 """
+
+        return self.__position[v]
+
+    @property
+    def cycle_arc(self):
+        """ 有向サイクルを作るため最初に棄却された弧 (source, target). 存在しない場合は None. """
+
+        return self.__cycle_arc
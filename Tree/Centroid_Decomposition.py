@@ -0,0 +1,242 @@
+from Tree import *
+from array import array
+from bisect import bisect_right
+
+class Centroid_Decomposition:
+    __slots__ = ("tree", "N", "index", "parent", "level", "dist", "__near", "__branch", "__best", "__touched")
+
+    def __init__(self, T: Tree):
+        """ 木 T の重心分解を行う.
+
+        Args:
+            T (Tree): 確定済み (seal 済み) の木
+
+        Attributes:
+            parent (list[int]): 重心分解木における親 (根は -1)
+            level (list[int]): 重心分解木における深さ
+            dist (list[array]): dist[k][v] = (頂点 v と, 頂点 v の深さ k の重心先祖との距離). 深さごとに array('i') で持つ.
+        """
+
+        assert not T.is_mutable()
+
+        N = T.N; index = T.index
+        self.tree = T
+        self.N = N
+        self.index = index
+
+        adj = [[] for _ in range(N + index)]
+        for v in range(index, index + N):
+            adj[v] = T.children[v][:]
+            if v != T.root:
+                adj[v].append(T.parent[v])
+
+        removed = [False] * (N + index)
+        size = [0] * (N + index)
+        pre = [-1] * (N + index)
+        branch_id = [-1] * (N + index)
+
+        parent = [-1] * (N + index)
+        level = [-1] * (N + index)
+        dist = []
+        near = [None] * (N + index)
+        branch = [None] * (N + index)
+
+        # (探索を始める頂点, 親の重心, 深さ, 親の重心からの距離のリスト)
+        stack = [(T.root, -1, 0, None)]
+        while stack:
+            start, p, k, from_parent = stack.pop()
+
+            # 連結成分を列挙し, 部分木のサイズを求める.
+            order = [start]; pre[start] = -1
+            for x in order:
+                for y in adj[x]:
+                    if y != pre[x] and not removed[y]:
+                        pre[y] = x
+                        order.append(y)
+
+            for x in reversed(order):
+                size[x] = 1
+                for y in adj[x]:
+                    if y != pre[x] and not removed[y]:
+                        size[x] += size[y]
+
+            # 重心を求める.
+            total = len(order); half = total // 2
+            c = start
+            while True:
+                for y in adj[c]:
+                    if y != pre[c] and not removed[y] and size[y] > half:
+                        c = y
+                        break
+                else:
+                    break
+
+            parent[c] = p
+            level[c] = k
+            branch[c] = from_parent
+            if len(dist) == k:
+                dist.append(array('i', [-1]) * (N + index))
+            dist_k = dist[k]
+
+            # 重心 c からの距離を求める (BFS 順なので距離は昇順になる).
+            dist_k[c] = 0
+            children = [y for y in adj[c] if not removed[y]]
+            lists = [array('i', [1]) for _ in children]
+            for i, y in enumerate(children):
+                dist_k[y] = 1
+                branch_id[y] = i
+
+            queue = children[:]
+            for x in queue:
+                for y in adj[x]:
+                    if y != c and dist_k[y] == -1 and not removed[y]:
+                        dist_k[y] = dist_k[x] + 1
+                        branch_id[y] = branch_id[x]
+                        lists[branch_id[y]].append(dist_k[y])
+                        queue.append(y)
+
+            near[c] = array('i', [0]); near[c].extend(dist_k[x] for x in queue)
+            removed[c] = True
+
+            for i, y in enumerate(children):
+                stack.append((y, c, k + 1, lists[i]))
+
+        self.parent = parent
+        self.level = level
+        self.dist = dist
+        self.__near = near
+        self.__branch = branch
+        self.__best = [-1] * (N + index)
+        self.__touched = []
+
+    def ancestors(self, v: int):
+        """ 重心分解木における頂点 v の先祖 c (v 自身を含む) と, v と c の距離の組を v に近い方から yield する.
+
+        Args:
+            v (int): 頂点番号
+        """
+
+        parent = self.parent; level = self.level; dist = self.dist
+        c = v
+        while c != -1:
+            yield c, dist[level[c]][v]
+            c = parent[c]
+
+    def distance(self, u: int, v: int) -> int:
+        """ 2 頂点 u, v 間の距離を求める.
+
+        Args:
+            u (int): 頂点番号
+            v (int): 頂点番号
+
+        Returns:
+            int: u, v 間の距離
+        """
+
+        parent = self.parent; level = self.level
+        a = u; b = v
+        while a != b:
+            if level[a] < level[b]:
+                b = parent[b]
+            else:
+                a = parent[a]
+
+        dist_k = self.dist[level[a]]
+        return dist_k[u] + dist_k[v]
+
+    #距離が k 以下の頂点
+    def count_within(self, v: int, k: int) -> int:
+        """ 頂点 v からの距離が k 以下である頂点の個数を求める.
+
+        Args:
+            v (int): 頂点番号
+            k (int): 距離の上限
+
+        Returns:
+            int: 頂点 v からの距離が k 以下である頂点の個数 (v 自身も含む)
+        """
+
+        if k < 0:
+            return 0
+
+        near = self.__near; branch = self.__branch
+        count = 0
+        x = -1
+        for c, d in self.ancestors(v):
+            if d <= k:
+                count += bisect_right(near[c], k - d)
+                if x != -1:
+                    count -= bisect_right(branch[x], k - d)
+            x = c
+        return count
+
+    def count_pairs_within(self, k: int) -> int:
+        """ 距離が k 以下である (相異なる) 2 頂点の非順序対の個数を求める.
+
+        Args:
+            k (int): 距離の上限
+
+        Returns:
+            int: 2 頂点の非順序対の個数
+        """
+
+        def pairs(A):
+            """ A (昇順) において, i < j, A[i] + A[j] <= k を満たす (i, j) の個数. """
+            res = 0
+            j = len(A) - 1
+            for i in range(len(A)):
+                while j > i and A[i] + A[j] > k:
+                    j -= 1
+                if j <= i:
+                    break
+                res += j - i
+            return res
+
+        count = 0
+        for v in range(self.index, self.index + self.N):
+            count += pairs(self.__near[v])
+            if self.__branch[v] is not None:
+                count -= pairs(self.__branch[v])
+        return count
+
+    #印の付いた頂点
+    def mark(self, v: int):
+        """ 頂点 v に印を付ける.
+
+        Args:
+            v (int): 頂点番号
+        """
+
+        best = self.__best
+        for c, d in self.ancestors(v):
+            if best[c] == -1:
+                self.__touched.append(c)
+                best[c] = d
+            elif d < best[c]:
+                best[c] = d
+
+    def nearest_marked(self, v: int, default = -1) -> int:
+        """ 頂点 v から最も近い印の付いた頂点までの距離を求める.
+
+        Args:
+            v (int): 頂点番号
+            default (optional): 印の付いた頂点が存在しない場合の返り値. Defaults to -1.
+
+        Returns:
+            int: 最も近い印の付いた頂点までの距離
+        """
+
+        best = self.__best
+        ans = -1
+        for c, d in self.ancestors(v):
+            if best[c] != -1 and (ans == -1 or best[c] + d < ans):
+                ans = best[c] + d
+        return ans if ans != -1 else default
+
+    def clear_marks(self):
+        """ 全ての印を取り除く (計算量は印を付けた回数に比例する). """
+
+        best = self.__best
+        for c in self.__touched:
+            best[c] = -1
+        self.__touched.clear()
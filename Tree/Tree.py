@@ -800,6 +800,44 @@ class Tree:
             X+=self.distance(S[i],S[i+1])
         return (X+self.distance(S[-1],S[0]))//2
 
+    def auxiliary_tree(self, S):
+        """ S と S の要素同士の最小共通先祖からなる圧縮された木 (Auxiliary Tree) を求める.
+
+        [output]
+        vertex: 圧縮された木の頂点 (in_time の昇順, vertex[0] が根)
+        parent: parent[i] は vertex[i] の親の vertex におけるインデックス (根は -1)
+
+        ※ 計算量は O(|S| log |S|) (LCA の前計算を除く).
+        """
+
+        assert self.__after_seal_check(*S)
+
+        if not S:
+            return { 'vertex': [], 'parent': [] }
+
+        if not hasattr(self, "lca_dst"):
+            self.__lca_prepare()
+
+        in_time=self.in_time; out_time=self.out_time
+        lca=self.lowest_common_ancestor
+
+        V=sorted(set(S), key=lambda v: in_time[v])
+        for i in range(len(V)-1):
+            V.append(lca(V[i], V[i+1]))
+        V=sorted(set(V), key=lambda v: in_time[v])
+
+        K=len(V)
+        parent=[-1]*K
+        stack=[0]
+        for i in range(1, K):
+            t=in_time[V[i]]
+            while out_time[V[stack[-1]]]<=t:
+                stack.pop()
+            parent[i]=stack[-1]
+            stack.append(i)
+
+        return { 'vertex': V, 'parent': parent }
+
 #=================================================
 def Making_Tree_from_Adjacent_List(N, A, root, index=0):
     """ 隣接リストから木を作る."""
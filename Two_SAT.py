@@ -3,6 +3,9 @@
 例えば, ~0=-1 なので, X_{-1} は not X_0 を意味する.
 """
 
+from array import array
+from Strongly_Connected_Components import Arc_List_to_CSR, Strongly_Connected_Components_CSR
+
 class Two_SAT:
     def __init__(self, N: int = 0):
         """ N 変数の 2-SAT を定義する.
@@ -14,11 +17,12 @@ class Two_SAT:
         self.N = N
         self.var_num = N
 
-        self.arc: list[int] = [[] for _ in range(2 * N)]
-        self.rev: list[int] = [[] for _ in range(2 * N)]
+        # 含意グラフの弧 (インデックス source[j] -> target[j]) を平坦な配列で持つ.
+        self.source = array('i')
+        self.target = array('i')
 
     def __var_to_index(self, v: int) -> int:
-        """ 反転の情報を含んだ変数番号から, arc, rev におけるインデックスを求める.
+        """ 反転の情報を含んだ変数番号から, 含意グラフにおけるインデックスを求める.
 
         Args:
             v (int): 反転の情報を含んだ変数番号
@@ -42,14 +46,11 @@ class Two_SAT:
         m = self.var_num
         self.var_num += k
 
-        self.arc.extend([[] for _ in range(2*k)])
-        self.rev.extend([[] for _ in range(2*k)])
-
         return list(range(m, m + k))
 
     def __add_clause(self,i,j):
-        self.arc[self.__var_to_index(i)].append(self.__var_to_index(j))
-        self.rev[self.__var_to_index(j)].append(self.__var_to_index(i))
+        self.source.append(self.__var_to_index(i))
+        self.target.append(self.__var_to_index(j))
 
     def add_imply(self, i: int, j: int):
         """ X_i -> X_j を追加する.
@@ -157,47 +158,9 @@ class Two_SAT:
 
     def calculate(self):
         n = self.var_num
-        group = [0] * (2 * n)
-        order = []
-
-        for s in range(2 * n):
-            if group[s]:
-                continue
-
-            stack = [s]
-            group[s] = -1
-
-            while stack:
-                u = stack.pop()
-                for v in self.arc[u]:
-                    if group[v]:
-                        continue
-
-                    group[v] = -1
-
-                    stack.append(u)
-                    stack.append(v)
-                    break
-                else:
-                    order.append(u)
-
-        k = 0
-        for s in reversed(order):
-            if group[s] != -1:
-                continue
-
-            stack = [s]
-            group[s] = k
-
-            while stack:
-                u = stack.pop()
-                for v in self.rev[u]:
-                    if group[v] != -1:
-                        continue
-
-                    group[v] = k
-                    stack.append(v)
-            k += 1
+        offset, target = Arc_List_to_CSR(2 * n, self.source, self.target)
+        group, _ = Strongly_Connected_Components_CSR(2 * n, offset, target)
+        del offset, target
 
         ans = [None] * n
         for i in range(n):
@@ -0,0 +1,156 @@
+from RollBack_Union_Find import RollBack_Union_Find
+
+class Offline_Dynamic_Connectivity:
+    def __init__(self, N: int):
+        """ 0, 1, ..., (N - 1) を頂点とする空グラフに対する, 辺の追加・削除と連結性のクエリを先読みで処理する.
+
+        Args:
+            N (int): 頂点数
+        """
+
+        self.N = N
+        self.__alive: dict[tuple[int, int], list[int]] = {}
+        self.__intervals: list[tuple[int, int, int, int]] = []
+        self.__queries: list[tuple[int, int, int]] = []
+        self.__ans: list = None
+
+    def __normalize(self, u: int, v: int) -> tuple[int, int]:
+        return (u, v) if u <= v else (v, u)
+
+    @property
+    def query_count(self) -> int:
+        return len(self.__queries)
+
+    def add_edge(self, u: int, v: int):
+        """ 無向辺 uv を追加する (多重辺でもよい).
+
+        Args:
+            u (int): 端点
+            v (int): 端点
+        """
+
+        assert 0 <= u < self.N
+        assert 0 <= v < self.N
+
+        key = self.__normalize(u, v)
+        if key not in self.__alive:
+            self.__alive[key] = []
+        self.__alive[key].append(self.query_count)
+
+    def remove_edge(self, u: int, v: int):
+        """ 無向辺 uv を (1 本) 削除する.
+
+        Args:
+            u (int): 端点
+            v (int): 端点
+        """
+
+        key = self.__normalize(u, v)
+        assert self.__alive.get(key), f"辺 {key} は存在しません."
+
+        l = self.__alive[key].pop()
+        if l < self.query_count:
+            self.__intervals.append((l, self.query_count, u, v))
+
+    def same(self, u: int, v: int) -> int:
+        """ 現時点で頂点 u, v が連結かどうかを問うクエリを追加する.
+
+        Args:
+            u (int): 頂点
+            v (int): 頂点
+
+        Returns:
+            int: クエリの番号
+        """
+
+        assert 0 <= u < self.N
+        assert 0 <= v < self.N
+
+        self.__queries.append((0, u, v))
+        return self.query_count - 1
+
+    def group_count(self) -> int:
+        """ 現時点での連結成分の個数を問うクエリを追加する.
+
+        Returns:
+            int: クエリの番号
+        """
+
+        self.__queries.append((1, -1, -1))
+        return self.query_count - 1
+
+    def calculate(self) -> list:
+        """ 全てのクエリに答える.
+
+        Returns:
+            list: i 番目のクエリの答え (same ならば bool, group_count ならば int) を i 番目に持つリスト
+
+        計算量: O((Q + M) log Q log N) (Q はクエリの個数, M は辺の追加の回数)
+        """
+
+        Q = self.query_count
+        queries = self.__queries
+        ans = [None] * Q
+        if Q == 0:
+            self.__ans = ans
+            return ans
+
+        size = 1
+        while size < Q:
+            size *= 2
+
+        # 時刻の区間 [l, r) に存在する辺をセグメント木の節点に載せる.
+        node_edges = [[] for _ in range(2 * size)]
+        intervals = self.__intervals[:]
+        for key, starts in self.__alive.items():
+            for l in starts:
+                if l < Q:
+                    intervals.append((l, Q, key[0], key[1]))
+
+        for l, r, u, v in intervals:
+            l += size; r += size
+            while l < r:
+                if l & 1:
+                    node_edges[l].append((u, v))
+                    l += 1
+                if r & 1:
+                    r -= 1
+                    node_edges[r].append((u, v))
+                l >>= 1; r >>= 1
+
+        U = RollBack_Union_Find(self.N)
+        snap = [0] * (2 * size)
+        stack = [1]
+        while stack:
+            k = stack.pop()
+            if k >= 0:
+                snap[k] = U.get_time()
+                for u, v in node_edges[k]:
+                    U.union(u, v)
+
+                if k >= size:
+                    q = k - size
+                    t, u, v = queries[q]
+                    if t == 0:
+                        ans[q] = U.same(u, v)
+                    else:
+                        ans[q] = U.group_count()
+                    U.rollback(snap[k])
+                    continue
+
+                stack.append(~k)
+                # 右の子にクエリが存在しないならば, 探索しない.
+                if ((2 * k + 1) << (size.bit_length() - (2 * k + 1).bit_length())) - size < Q:
+                    stack.append(2 * k + 1)
+                stack.append(2 * k)
+            else:
+                U.rollback(snap[~k])
+
+        self.__ans = ans
+        return ans
+
+    @property
+    def ans(self) -> list:
+        """ calculate で求めた答えのリスト (calculate を呼ぶ前は None). """
+
+        return self.__ans
@@ -0,0 +1,184 @@
+from bisect import bisect_right
+
+class Partially_Persistent_Union_Find:
+    __slots__ = ("__n", "parents", "union_time", "__size_time", "__size_value", "__now")
+
+    inf = float("inf")
+
+    def __init__(self, N: int):
+        """ 0, 1, ..., (N - 1) を要素に持つ部分永続 Union Find を生成する.
+
+        時刻は union を呼び出した回数 (併合が起きなかった場合も含む) であり, "時刻 t" は t 回目の union の直後の状態を表す.
+
+        Args:
+            N (int): 要素数
+        """
+
+        self.__n = N
+        self.parents = list(range(N))
+        self.union_time = [Partially_Persistent_Union_Find.inf] * N
+        self.__size_time = [[0] for _ in range(N)]
+        self.__size_value = [[1] for _ in range(N)]
+        self.__now = 0
+
+    @property
+    def N(self) -> int:
+        return self.__n
+
+    @property
+    def now(self) -> int:
+        """ 現在の時刻
+
+        Returns:
+            int: 現在の時刻 (これまでに union を呼び出した回数)
+        """
+
+        return self.__now
+
+    def find_at(self, x: int, t: int) -> int:
+        """ 時刻 t において要素 x が属している族の代表元を求める.
+
+        Args:
+            x (int): 要素
+            t (int): 時刻
+
+        Returns:
+            int: 時刻 t における x の代表元
+        """
+
+        parents = self.parents; union_time = self.union_time
+        while union_time[x] <= t:
+            x = parents[x]
+        return x
+
+    def find(self, x: int) -> int:
+        """ 現在において要素 x が属している族の代表元を求める.
+
+        Args:
+            x (int): 要素
+
+        Returns:
+            int: x の代表元
+        """
+
+        return self.find_at(x, self.__now)
+
+    def union(self, x: int, y: int) -> bool:
+        """ 要素 x と要素 y を同一視する (時刻が 1 進む).
+
+        Args:
+            x (int): 要素
+            y (int): 要素
+
+        Returns:
+            bool: 元々非連結ならば True, 元々連結ならば False.
+        """
+
+        self.__now += 1
+        t = self.__now
+
+        # 現在の根は union_time が inf である.
+        parents = self.parents; union_time = self.union_time
+        inf = Partially_Persistent_Union_Find.inf
+        while union_time[x] != inf:
+            x = parents[x]
+        while union_time[y] != inf:
+            y = parents[y]
+
+        if x == y:
+            return False
+
+        size_x = self.__size_value[x][-1]
+        size_y = self.__size_value[y][-1]
+        if size_x < size_y:
+            x, y = y, x
+
+        parents[y] = x
+        union_time[y] = t
+        self.__size_time[x].append(t)
+        self.__size_value[x].append(size_x + size_y)
+        return True
+
+    def same_at(self, x: int, y: int, t: int) -> bool:
+        """ 時刻 t において要素 x, y は同一視されているか?
+
+        Args:
+            x (int): 要素
+            y (int): 要素
+            t (int): 時刻
+
+        Returns:
+            bool: 同一視されていれば True
+        """
+
+        return self.find_at(x, t) == self.find_at(y, t)
+
+    def same(self, x: int, y: int) -> bool:
+        """ 現在において要素 x, y は同一視されているか?
+
+        Args:
+            x (int): 要素
+            y (int): 要素
+
+        Returns:
+            bool: 同一視されていれば True
+        """
+
+        return self.same_at(x, y, self.__now)
+
+    def size_at(self, x: int, t: int) -> int:
+        """ 時刻 t において要素 x が属している族のサイズを求める.
+
+        Args:
+            x (int): 要素
+            t (int): 時刻
+
+        Returns:
+            int: 時刻 t における x が属している族のサイズ
+        """
+
+        r = self.find_at(x, t)
+        i = bisect_right(self.__size_time[r], t) - 1
+        return self.__size_value[r][i]
+
+    def size(self, x: int) -> int:
+        """ 現在において要素 x が属している族のサイズを求める.
+
+        Args:
+            x (int): 要素
+
+        Returns:
+            int: x が属している族のサイズ
+        """
+
+        return self.__size_value[self.find(x)][-1]
+
+    def first_connected_time(self, x: int, y: int, default = -1) -> int:
+        """ 要素 x, y が初めて同一視された時刻を求める.
+
+        Args:
+            x (int): 要素
+            y (int): 要素
+            default (optional): 現在でも同一視されていない場合の返り値. Defaults to -1.
+
+        Returns:
+            int: x, y が同一視されている最小の時刻
+        """
+
+        parents = self.parents; union_time = self.union_time
+        t = 0
+        while x != y:
+            # 併合された時刻が早い方を登らせる. 根に到達した場合, その時刻は inf になる.
+            if union_time[x] < union_time[y]:
+                t = union_time[x]
+                x = parents[x]
+            else:
+                t = union_time[y]
+                y = parents[y]
+
+            if t == Partially_Persistent_Union_Find.inf:
+                return default
+        return t
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.N})"
@@ -1,17 +1,24 @@
 class Union_Find:
     __slots__ = ("__n", "parents", "rank", "edges", "__group_number")
 
-    def __init__(self, N: int) -> None:
+    def __init__(self, N: int, compact: bool = False) -> None:
         """ 0, 1, ..., (N - 1) を要素に持つ Union Find を生成する.
 
         Args:
             N (int): 要素数
+            compact (bool, optional): True にすると, parents, edges を array('i') で保持し, rank を持たずに (parents に記録されている) サイズによって併合する. Defaults to False.
         """
 
         self.__n = N
-        self.parents=[-1]*N
-        self.rank=[0]*N
-        self.edges=[0]*N
+        if compact:
+            from array import array
+            self.parents = array('i', [-1]) * N
+            self.rank = None
+            self.edges = array('i', [0]) * N
+        else:
+            self.parents=[-1]*N
+            self.rank=[0]*N
+            self.edges=[0]*N
         self.__group_number = N
 
     def add_vertex(self) -> int:
@@ -23,7 +30,8 @@ class Union_Find:
 
         self.__n += 1
         self.parents.append(-1)
-        self.rank.append(0)
+        if self.rank is not None:
+            self.rank.append(0)
         self.edges.append(0)
         self.__group_number += 1
         return self.__n - 1
@@ -79,8 +87,12 @@ class Union_Find:
             self.edges[x]+=1
             return False
 
-        if (not force) and (self.rank[x] < self.rank[y]):
-            x,y=y,x
+        if not force:
+            if self.rank is None:
+                if self.parents[x] > self.parents[y]:
+                    x,y=y,x
+            elif self.rank[x] < self.rank[y]:
+                x,y=y,x
 
         self.__group_number-=1
 
@@ -90,10 +102,83 @@ class Union_Find:
         self.parents[x]+=self.parents[y]
         self.parents[y]=x
 
-        if self.rank[x]==self.rank[y]:
+        if self.rank is not None and self.rank[x]==self.rank[y]:
             self.rank[x]+=1
         return True
 
+    def find_many(self, xs: list[int]) -> list[int]:
+        """ 各要素 x in xs が属している族をまとめて調べる.
+
+        Args:
+            xs (list[int]): 要素のリスト
+
+        Returns:
+            list[int]: i 番目が xs[i] の属している族であるリスト
+        """
+
+        parents = self.parents
+        res = []
+        for x in xs:
+            a = x
+            while parents[a] >= 0:
+                a = parents[a]
+
+            while parents[x] >= 0:
+                parents[x], x = a, parents[x]
+
+            res.append(a)
+        return res
+
+    def union_many(self, us: list[int], vs: list[int]) -> int:
+        """ 各 i に対して, 要素 us[i] と要素 vs[i] を同一視する.
+
+        Args:
+            us (list[int]): 要素のリスト
+            vs (list[int]): 要素のリスト (us と同じ長さ)
+
+        Returns:
+            int: 実際に族が併合された回数
+        """
+
+        assert len(us) == len(vs)
+
+        parents = self.parents; rank = self.rank; edges = self.edges
+        merged = 0
+        for x, y in zip(us, vs):
+            a = x
+            while parents[a] >= 0:
+                a = parents[a]
+            while parents[x] >= 0:
+                parents[x], x = a, parents[x]
+
+            b = y
+            while parents[b] >= 0:
+                b = parents[b]
+            while parents[y] >= 0:
+                parents[y], y = b, parents[y]
+
+            if a == b:
+                edges[a] += 1
+                continue
+
+            if rank is None:
+                if parents[a] > parents[b]:
+                    a, b = b, a
+            else:
+                if rank[a] < rank[b]:
+                    a, b = b, a
+                if rank[a] == rank[b]:
+                    rank[a] += 1
+
+            edges[a] += edges[b] + 1
+            edges[b] = 0
+            parents[a] += parents[b]
+            parents[b] = a
+            merged += 1
+
+        self.__group_number -= merged
+        return merged
+
     def size(self, x: int) -> int:
         """ 要素 x が属している族のサイズを求める
 
@@ -117,6 +202,22 @@ class Union_Find:
         """
         return self.find(x) == self.find(y)
 
+    def same_many(self, us: list[int], vs: list[int]) -> list[bool]:
+        """ 各 i に対して, 要素 us[i], vs[i] が同一視されているかをまとめて判定する.
+
+        Args:
+            us (list[int]): 要素のリスト
+            vs (list[int]): 要素のリスト (us と同じ長さ)
+
+        Returns:
+            list[bool]: i 番目が us[i], vs[i] が同一視されているかどうかであるリスト
+        """
+
+        assert len(us) == len(vs)
+
+        find = self.find
+        return [find(x) == find(y) for x, y in zip(us, vs)]
+
     def members(self, x: int) -> list[int]:
         """ 要素 x と同一視されている要素のリスト
 
@@ -214,3 +315,43 @@ class Union_Find:
 
     def __setitem__(self, x: int, y: int) -> None:
         self.union(x, y)
+
+#=================================================
+def Connected_Component_Labeling(N: int, us: list[int], vs: list[int]) -> list[int]:
+    """ 頂点が 0, 1, ..., (N - 1), 辺が us[i] vs[i] である無向グラフの連結成分のラベルを求める.
+
+    Args:
+        N (int): 頂点数
+        us (list[int]): 辺の端点のリスト
+        vs (list[int]): 辺の端点のリスト (us と同じ長さ)
+
+    Returns:
+        list[int]: 各頂点が属する連結成分の番号 (頂点番号が小さい順に 0, 1, 2, ... と番号を振る)
+    """
+
+    assert len(us) == len(vs)
+
+    # 静的な辺集合なので, 辺の情報を持たずに, path halving と大きい番号の根を小さい番号の根に繋ぐ併合で済ませる.
+    parents = list(range(N))
+    for x, y in zip(us, vs):
+        while parents[x] != x:
+            parents[x] = x = parents[parents[x]]
+        while parents[y] != y:
+            parents[y] = y = parents[parents[y]]
+
+        if x < y:
+            parents[y] = x
+        elif y < x:
+            parents[x] = y
+
+    label = [0] * N
+    k = 0
+    for v in range(N):
+        p = parents[v]
+        if p == v:
+            label[v] = k
+            k += 1
+        else:
+            # p < v なので, p のラベルは既に確定している.
+            label[v] = label[p]
+    return label
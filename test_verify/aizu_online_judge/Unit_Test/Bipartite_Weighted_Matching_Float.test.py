@@ -0,0 +1,40 @@
+# verification-helper: PROBLEM https://onlinejudge.u-aizu.ac.jp/courses/lesson/2/ITP1/1/ITP1_1_A
+
+# 小数の重みを持つ問題が Library Checker に無いので, ITP1_1_A (Hello World) を利用した単体テストとする.
+
+#==================================================
+import os
+import sys
+
+# Bipartite_Weighted_Matching.py は同じフォルダの Min_Cost_Flow.py を "from Min_Cost_Flow import *" で読み込むので,
+# リポジトリの根ではなく, Min_Cost_Flow フォルダを先に探すようにする.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../../Min_Cost_Flow"))
+from Bipartite_Weighted_Matching import *
+
+#==================================================
+def close(X, Y):
+    return len(X) == len(Y) and all(abs(x - y) < 1e-9 for x, y in zip(X, Y))
+
+def verify():
+    # 重みが小数のとき, 各サイズの最大重みを切り捨てずに求める.
+    G = Bipartite_Weighted_Matching(2, 2)
+    G.add_edge(0, 0, 2.5); G.add_edge(1, 1, 1.5); G.add_edge(0, 1, 1.0)
+    assert close(G.matching_each_size(), [0, 2.5, 4.0])
+    assert close(G.matching_vertex_duplicate_each_size([1, 1], [1, 1]), [0, 2.5, 4.0])
+
+    G = Bipartite_Weighted_Matching(3, 3)
+    for a in range(3):
+        for b in range(3):
+            G.add_edge(a, b, [[3.1, 2.6, 0.5], [2.6, 1.9, 0.4], [0.95, 0.5, 0.3]][a][b])
+    assert close(G.matching_each_size(), [0, 3.1, 5.2, 5.5])
+
+    # 重みが整数のときは整数のまま
+    G = Bipartite_Weighted_Matching(2, 2)
+    G.add_edge(0, 0, 5); G.add_edge(0, 1, 3); G.add_edge(1, 0, 4)
+    X = G.matching_each_size()
+    assert X == [0, 5, 7] and all(type(x) is int for x in X)
+
+    print("Hello World")
+
+#==================================================
+verify()
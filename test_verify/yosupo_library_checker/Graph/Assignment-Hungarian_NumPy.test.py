@@ -0,0 +1,21 @@
+# verification-helper: PROBLEM https://judge.yosupo.jp/problem/assignment
+
+#==================================================
+from Hungarian import *
+
+import sys
+input=sys.stdin.readline
+write=sys.stdout.write
+
+#==================================================
+def verify():
+    N = int(input())
+    A = [list(map(int, input().split())) for _ in range(N)]
+
+    res = Hungarian_NumPy(A, maximize = False)
+
+    print(int(res['value']))
+    print(*res['assignment'])
+
+#==================================================
+verify()
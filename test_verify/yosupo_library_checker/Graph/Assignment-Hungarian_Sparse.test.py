@@ -0,0 +1,24 @@
+# verification-helper: PROBLEM https://judge.yosupo.jp/problem/assignment
+
+#==================================================
+from Hungarian import *
+
+import sys
+input=sys.stdin.readline
+write=sys.stdout.write
+
+#==================================================
+def verify():
+    N = int(input())
+    edges = []
+    for i in range(N):
+        for j, a in enumerate(map(int, input().split())):
+            edges.append((i, j, a))
+
+    res = Hungarian_Sparse(N, N, edges, maximize = False)
+
+    print(res['value'])
+    print(*res['assignment'])
+
+#==================================================
+verify()
@@ -0,0 +1,35 @@
+# verification-helper: PROBLEM https://judge.yosupo.jp/problem/biconnected_components
+
+#==================================================
+from Graph.Graph.Graph import Graph as Undirected_Graph
+from Graph.Graph.LowLink import *
+
+import sys
+input=sys.stdin.readline
+write=sys.stdout.write
+
+#==================================================
+def verify():
+    N, M = map(int, input().split())
+
+    G = Undirected_Graph(N)
+    for j in range(M):
+        a, b = map(int, input().split())
+        G.add_edge(a, b, j)
+
+    # ブロック N + i の頂点は, Block-Cut 木における親 (関節点又は DFS の根) と子の頂点である.
+    parent = Block_Cut_Tree(G)['parent']
+    B = len(parent) - N
+    blocks = [[parent[N + i]] for i in range(B)]
+    for v in range(N):
+        if parent[v] != -1:
+            blocks[parent[v] - N].append(v)
+
+    def writer(block):
+        return f"{len(block)} {' '.join(map(str, block))}"
+
+    print(B)
+    write("\n".join(map(writer, blocks)))
+
+#==================================================
+verify()
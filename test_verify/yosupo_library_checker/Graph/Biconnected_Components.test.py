@@ -0,0 +1,29 @@
+# verification-helper: PROBLEM https://judge.yosupo.jp/problem/biconnected_components
+
+#==================================================
+from Graph.Graph.Graph import Graph as Undirected_Graph
+from Graph.Graph.LowLink import *
+
+import sys
+input=sys.stdin.readline
+write=sys.stdout.write
+
+#==================================================
+def verify():
+    N, M = map(int, input().split())
+
+    G = Undirected_Graph(N)
+    for j in range(M):
+        a, b = map(int, input().split())
+        G.add_edge(a, b, j)
+
+    blocks = Biconnected_Components(G)
+
+    def writer(block):
+        return f"{len(block)} {' '.join(map(str, block))}"
+
+    print(len(blocks))
+    write("\n".join(map(writer, blocks)))
+
+#==================================================
+verify()
@@ -0,0 +1,22 @@
+# verification-helper: PROBLEM https://judge.yosupo.jp/problem/chromatic_number
+
+#==================================================
+from Graph.Graph.Graph import Graph as Undirected_Graph
+from Graph.Graph.Coloring import *
+
+import sys
+input=sys.stdin.readline
+
+#==================================================
+def verify():
+    N, M = map(int, input().split())
+
+    G = Undirected_Graph(N)
+    for _ in range(M):
+        u, v = map(int, input().split())
+        G.add_edge(u, v)
+
+    print(Chromatic_Number_NumPy(G))
+
+#==================================================
+verify()
@@ -0,0 +1,37 @@
+# verification-helper: PROBLEM https://judge.yosupo.jp/problem/bipartitematching
+
+#==================================================
+from Flow.Flow import Max_Flow_HLPP
+
+import sys
+input=sys.stdin.readline
+write=sys.stdout.write
+
+#==================================================
+def verify():
+    L, R, M = map(int, input().split())
+
+    # 始点 L + R -> 左側 a -> 右側 L + b -> 終点 L + R + 1
+    source = L + R; target = L + R + 1
+    F = Max_Flow_HLPP(L + R + 2)
+    E = []
+    for _ in range(M):
+        a, b = map(int, input().split())
+        E.append((F.add_arc(a, L + b, 1), a, b))
+
+    for a in range(L):
+        F.add_arc(source, a, 1)
+
+    for b in range(R):
+        F.add_arc(L + b, target, 1)
+
+    K = F.max_flow(source, target)
+
+    H = [(a, b) for i, a, b in E if F.get_arc(i).cap == 0]
+
+    print(K)
+    write("\n".join(f"{a} {b}" for a, b in H))
+    print()
+
+#==================================================
+verify()
@@ -0,0 +1,81 @@
+# verification-helper: PROBLEM https://judge.yosupo.jp/problem/min_cost_b_flow
+
+#==================================================
+from Min_Cost_Flow.Min_Cost_Flow import Min_Cost_Flow
+
+import sys
+input=sys.stdin.readline
+write=sys.stdout.write
+
+#==================================================
+def verify():
+    N, M = map(int, input().split())
+    b = [int(input()) for _ in range(N)]
+
+    # 下限 l を先に流した上で, 超過・不足を仮想の始点 N, 終点 N + 1 で補う.
+    source = N; target = N + 1
+    F = Min_Cost_Flow(N + 2)
+    E = []
+    base_cost = 0
+    for _ in range(M):
+        s, t, l, u, c = map(int, input().split())
+        if s == t:
+            # 自己ループは費用が負ならば上限まで, そうでなければ下限だけ流す.
+            f = u if c < 0 else l
+            E.append((s, t, l, u, c, -1, f))
+            base_cost += f * c
+            continue
+
+        b[s] -= l; b[t] += l
+        base_cost += l * c
+        E.append((s, t, l, u, c, F.add_arc(s, t, u - l, c), l))
+
+    if sum(b) != 0:
+        print("infeasible")
+        return
+
+    supply = []; demand = 0
+    for v in range(N):
+        if b[v] > 0:
+            supply.append(F.add_arc(source, v, b[v], 0))
+            demand += b[v]
+        elif b[v] < 0:
+            F.add_arc(v, target, -b[v], 0)
+
+    # 負の費用の閉路にも流す必要があるので, ネットワーク単体法を用いる.
+    cost = F.flow(source, target, demand, method = "simplex")
+
+    flow = F.get_flow()
+    if sum(flow[i] for i in supply) != demand:
+        print("infeasible")
+        return
+
+    # 残余グラフ (元の辺のみ) での最短距離をポテンシャルとする (Bellman-Ford 法).
+    arcs = []
+    for s, t, l, u, c, i, _ in E:
+        if i == -1:
+            continue
+        f = flow[i]
+        if f < u - l:
+            arcs.append((s, t, c))
+        if f > 0:
+            arcs.append((t, s, -c))
+
+    p = [0] * N
+    for _ in range(N):
+        updated = False
+        for s, t, c in arcs:
+            if p[s] + c < p[t]:
+                p[t] = p[s] + c
+                updated = True
+        if not updated:
+            break
+
+    print(base_cost + cost)
+    write("\n".join(map(str, p)))
+    print()
+    write("\n".join(str(l + flow[i] if i != -1 else f) for _, _, l, _, _, i, f in E))
+    print()
+
+#==================================================
+verify()